@@ -9,17 +9,285 @@ for tracking project progress and activities.
 """
 
 import os
+import sys
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import asyncio
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple, Union
 
 # In a real implementation, you would use the GitHub API client library
 # For demonstration purposes, we're showing the structure
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Requests library not installed. Run: pip install requests")
 
+# aiohttp is only needed for AsyncGitHubManager
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson decodes response bodies straight from bytes and much faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Number of repositories fetched concurrently in get_user_activity
+MAX_WORKERS = 8
+
+# Maximum in-flight requests for AsyncGitHubManager
+ASYNC_MAX_CONCURRENCY = 20
+
+# Remaining-quota level below which requests wait for the rate limit reset,
+# and how many times a rate-limited request is retried
+RATE_LIMIT_THRESHOLD = 5
+RATE_LIMIT_RETRIES = 3
+
+# Seconds a cached response is served without revalidating against GitHub
+REPOS_CACHE_TTL = 60
+ACTIVITY_CACHE_TTL = 10
+
+# Largest page size accepted by the GitHub REST API
+PER_PAGE = 100
+
+# GitHub GraphQL endpoint and repositories aliased per query (kept under node limits)
+GRAPHQL_URL = 'https://api.github.com/graphql'
+GRAPHQL_CHUNK_SIZE = 50
+
+
+def _utc_timestamp(value: Union[datetime, str]) -> str:
+    """Format a datetime the way GitHub formats timestamps
+    
+    Args:
+        value: Datetime to format (naive values are treated as local time);
+            strings are assumed to be formatted already and returned as is
+        
+    Returns:
+        UTC ISO-8601 string such as '2025-03-14T09:30:00Z'
+    """
+    if isinstance(value, str):
+        return value
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _github_auth(token: Optional[str]) -> Tuple[Optional[str], Dict[str, str]]:
+    """Resolve the GitHub token and build the default request headers
+    
+    Args:
+        token: GitHub personal access token (falls back to GITHUB_TOKEN)
+        
+    Returns:
+        Tuple of resolved token (or None) and request headers
+    """
+    token = token or os.environ.get('GITHUB_TOKEN')
+    if not token:
+        print("Warning: No GitHub token provided. API rate limits will be restricted.")
+        
+    headers = {
+        'Accept': 'application/vnd.github.v3+json'
+    }
+    
+    if token:
+        headers['Authorization'] = f'token {token}'
+        
+    return token, headers
+
+
+def _owned_repos(repos: List[Dict[str, Any]], username: str) -> List[Tuple[str, str]]:
+    """Get the repositories owned by a user, skipping forks of others' repositories
+    
+    Args:
+        repos: List of repository dictionaries
+        username: GitHub username
+        
+    Returns:
+        List of (owner, repository name) tuples
+    """
+    uname = username.lower()
+    return [
+        (repo['owner']['login'], repo['name'])
+        for repo in repos
+        if repo['owner']['login'].lower() == uname
+    ]
+
+
+def _count_by_user(items: List[Dict[str, Any]], key: str, username: str) -> int:
+    """Count items whose user field belongs to a user
+    
+    Args:
+        items: List of commit, issue or pull request dictionaries
+        key: Field holding the user ('author' for commits, 'user' otherwise)
+        username: GitHub username
+        
+    Returns:
+        Number of matching items
+    """
+    uname = username.lower()
+    return sum(
+        1 for item in items
+        if (user := item.get(key)) and user.get('login', '').lower() == uname
+    )
+
+
+def _created_before(since_iso: str) -> Callable[[List[Dict[str, Any]]], bool]:
+    """Build a pagination stop check for PRs sorted newest first
+    
+    The pulls endpoint has no since filter, so PRs are sorted by creation date
+    and paging stops once a page reaches PRs older than the cutoff.
+    GitHub timestamps are UTC ISO-8601 strings that compare lexically.
+    
+    Args:
+        since_iso: Cutoff formatted with _utc_timestamp
+        
+    Returns:
+        Function returning True when a page ends before the cutoff
+    """
+    return lambda page: not page or page[-1]['created_at'] < since_iso
+
+
+# Slotted dataclasses need Python 3.10; older versions fall back to regular instances
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class RepoActivity:
+    """Activity counts for a single repository"""
+    commits: int = 0
+    issues_opened: int = 0
+    issues_closed: int = 0
+    pull_requests: int = 0
+
+
+def _activity_summary(username: str,
+                      since_days: int,
+                      repositories: Dict[str, RepoActivity]) -> Dict[str, Any]:
+    """Build the activity summary returned by get_user_activity
+    
+    Args:
+        username: GitHub username
+        since_days: Number of days looked back
+        repositories: Activity counts by repository name
+        
+    Returns:
+        Dictionary with activity summary
+    """
+    activity = {
+        'username': username,
+        'period': f"Last {since_days} days",
+        # Serialize to plain dicts at the boundary so callers can log/JSON-encode them
+        'repositories': {
+            repo_name: asdict(repo_activity)
+            for repo_name, repo_activity in repositories.items()
+        },
+        'total_commits': 0,
+        'total_issues_opened': 0,
+        'total_issues_closed': 0,
+        'total_prs': 0
+    }
+    
+    for repo_activity in repositories.values():
+        activity['total_commits'] += repo_activity.commits
+        activity['total_issues_opened'] += repo_activity.issues_opened
+        activity['total_issues_closed'] += repo_activity.issues_closed
+        activity['total_prs'] += repo_activity.pull_requests
+        
+    return activity
+
+
+class _CachedGet:
+    """GET helper that caches responses and revalidates them with ETags
+    
+    Responses are keyed by URL and query parameters. Within the TTL the cached
+    body is returned without a request; afterwards the stored ETag is sent as
+    If-None-Match so an unchanged resource costs a 304 instead of a full body.
+    """
+    
+    def __init__(self, request: Callable[..., 'requests.Response']):
+        """Initialize the cached GET helper
+        
+        Args:
+            request: Function called as request('GET', url, params=..., headers=...)
+                to issue requests
+        """
+        self.request = request
+        self._entries: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        
+    def __call__(self, 
+                 url: str, 
+                 params: Optional[Dict[str, Any]] = None,
+                 ttl: float = 0) -> Any:
+        """Get the decoded JSON body for a URL
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds a cached body is served without revalidation
+            
+        Returns:
+            Decoded JSON response body
+        """
+        body, _ = self.get_page(url, params, ttl)
+        return body
+    
+    def get_page(self, 
+                 url: str, 
+                 params: Optional[Dict[str, Any]] = None,
+                 ttl: float = 0) -> Tuple[Any, Optional[str]]:
+        """Get the decoded JSON body for a URL and the URL of the next page
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds a cached body is served without revalidation
+            
+        Returns:
+            Tuple of decoded JSON response body and next page URL (or None)
+        """
+        params = params or {}
+        key = (url, tuple(sorted(params.items())))
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            
+        if entry and time.time() - entry['fetched_at'] < ttl:
+            return entry['body'], entry['next_url']
+            
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+            
+        response = self.request('GET', url, params=params, headers=headers)
+        
+        if response.status_code == 304 and entry:
+            entry['fetched_at'] = time.time()
+            return entry['body'], entry['next_url']
+            
+        response.raise_for_status()
+        body = _json_loads(response.content)
+        next_url = response.links.get('next', {}).get('url')
+        
+        with self._lock:
+            self._entries[key] = {
+                'etag': response.headers.get('ETag'),
+                'body': body,
+                'next_url': next_url,
+                'fetched_at': time.time()
+            }
+            
+        return body, next_url
+
 
 class GitHubManager:
     """Manager class for GitHub operations"""
@@ -30,18 +298,76 @@ class GitHubManager:
         Args:
             token: GitHub personal access token
         """
-        self.token = token or os.environ.get('GITHUB_TOKEN')
-        if not self.token:
-            print("Warning: No GitHub token provided. API rate limits will be restricted.")
-            
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        self.token, self.headers = _github_auth(token)
+        self.base_url = 'https://api.github.com'
+        
+        # Reuse one keep-alive connection pool for every API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            respect_retry_after_header=True
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_WORKERS,
+            max_retries=retries
+        ))
+        self._cached_get = _CachedGet(self._request)
+        
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self.session.close()
+        
+    def _request(self, method: str, url: str, **kwargs) -> 'requests.Response':
+        """Send a request, waiting out GitHub rate limits instead of failing
+        
+        Rate-limited responses (403/429 with Retry-After or an exhausted
+        X-RateLimit-Remaining) are retried after the advertised wait. When the
+        remaining quota drops below RATE_LIMIT_THRESHOLD, the call sleeps until
+        the window resets so the next request does not get rejected.
         
-        if self.token:
-            self.headers['Authorization'] = f'token {self.token}'
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments passed to the session
             
-        self.base_url = 'https://api.github.com'
+        Returns:
+            HTTP response
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+            headers = response.headers
+            
+            if response.status_code in (403, 429) and attempt < RATE_LIMIT_RETRIES:
+                if 'Retry-After' in headers:
+                    wait = int(headers['Retry-After'])
+                elif headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+                    wait = int(headers['X-RateLimit-Reset']) - time.time()
+                else:
+                    # A plain 403 (e.g. missing permissions) will not succeed on retry
+                    return response
+                    
+                print(f"GitHub rate limit reached, retrying in {max(0, wait):.0f}s")
+                time.sleep(max(0, wait))
+                continue
+                
+            remaining = headers.get('X-RateLimit-Remaining')
+            if remaining is not None and int(remaining) < RATE_LIMIT_THRESHOLD and 'X-RateLimit-Reset' in headers:
+                wait = int(headers['X-RateLimit-Reset']) - time.time()
+                if wait > 0:
+                    print(f"GitHub rate limit nearly exhausted, waiting {wait:.0f}s for reset")
+                    time.sleep(wait)
+                    
+            return response
+    
+    def __enter__(self) -> 'GitHubManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
         
     def get_user_repos(self, username: str) -> List[Dict[str, Any]]:
         """Get repositories for a specific user
@@ -53,23 +379,58 @@ class GitHubManager:
             List of repository dictionaries
         """
         url = f"{self.base_url}/users/{username}/repos"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
         
-        return response.json()
+        pages = self._paginate(url, ttl=REPOS_CACHE_TTL)
+        return [repo for page in pages for repo in page]
+    
+    def _paginate(self, 
+                  url: str, 
+                  params: Optional[Dict[str, Any]] = None,
+                  ttl: float = 0,
+                  stop: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+                  items_key: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over the pages of a list endpoint
+        
+        Args:
+            url: URL of the first page
+            params: Query parameters for the first page
+            ttl: Seconds a cached page is served without revalidation
+            stop: Called with each page; pagination ends when it returns True
+            items_key: Key holding the item list when the response is an object
+                (e.g. 'items' for search endpoints)
+            
+        Yields:
+            Lists of items, one per page
+        """
+        params = dict(params or {})
+        params['per_page'] = PER_PAGE
+        
+        while url:
+            page, url = self._cached_get.get_page(url, params, ttl)
+            if items_key:
+                page = page.get(items_key, [])
+            yield page
+            
+            if stop and stop(page):
+                break
+                
+            # The next-page URL already carries the query string
+            params = None
     
     def get_repo_commits(self, 
                         owner: str, 
                         repo: str, 
-                        since: Optional[datetime] = None,
-                        until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+                        since: Optional[Union[datetime, str]] = None,
+                        until: Optional[Union[datetime, str]] = None,
+                        max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get commits for a specific repository
         
         Args:
             owner: Repository owner username
             repo: Repository name
-            since: Start date for commits (optional)
-            until: End date for commits (optional)
+            since: Start date for commits, as datetime or ISO-8601 string (optional)
+            until: End date for commits, as datetime or ISO-8601 string (optional)
+            max_pages: Maximum number of pages to fetch (optional, all by default)
             
         Returns:
             List of commit dictionaries
@@ -78,27 +439,25 @@ class GitHubManager:
         params = {}
         
         if since:
-            params['since'] = since.isoformat()
+            params['since'] = _utc_timestamp(since)
         if until:
-            params['until'] = until.isoformat()
+            params['until'] = _utc_timestamp(until)
             
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        
-        return response.json()
+        pages = self._paginate(url, params, ttl=ACTIVITY_CACHE_TTL)
+        return [commit for page in islice(pages, max_pages) for commit in page]
     
     def get_repo_issues(self, 
                        owner: str, 
                        repo: str, 
                        state: str = 'all',
-                       since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+                       since: Optional[Union[datetime, str]] = None) -> List[Dict[str, Any]]:
         """Get issues for a specific repository
         
         Args:
             owner: Repository owner username
             repo: Repository name
             state: Issue state ('open', 'closed', or 'all')
-            since: Start date for issues (optional)
+            since: Start date for issues, as datetime or ISO-8601 string (optional)
             
         Returns:
             List of issue dictionaries
@@ -107,34 +466,193 @@ class GitHubManager:
         params = {'state': state}
         
         if since:
-            params['since'] = since.isoformat()
+            params['since'] = _utc_timestamp(since)
             
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        
-        return response.json()
+        pages = self._paginate(url, params, ttl=ACTIVITY_CACHE_TTL)
+        return [issue for page in pages for issue in page]
     
     def get_repo_pull_requests(self, 
                               owner: str, 
                               repo: str, 
-                              state: str = 'all') -> List[Dict[str, Any]]:
+                              state: str = 'all',
+                              since: Optional[Union[datetime, str]] = None) -> List[Dict[str, Any]]:
         """Get pull requests for a specific repository
         
         Args:
             owner: Repository owner username
             repo: Repository name
             state: PR state ('open', 'closed', or 'all')
+            since: Only return PRs created at or after this date (optional)
             
         Returns:
             List of pull request dictionaries
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
         params = {'state': state}
+        
+        if not since:
+            pages = self._paginate(url, params, ttl=ACTIVITY_CACHE_TTL)
+            return [pr for page in pages for pr in page]
+            
+        # Newest first, stopping once a page reaches PRs older than the cutoff
+        since_iso = _utc_timestamp(since)
+        params.update({'sort': 'created', 'direction': 'desc'})
+        
+        pages = self._paginate(url, params, ttl=ACTIVITY_CACHE_TTL, stop=_created_before(since_iso))
+        return [pr for page in pages for pr in page if pr['created_at'] >= since_iso]
+    
+    def _search_issues(self, query: str) -> List[Dict[str, Any]]:
+        """Run an issue/PR search and return all matching items
+        
+        Args:
+            query: GitHub search query string
+            
+        Returns:
+            List of issue or pull request dictionaries
+        """
+        url = f"{self.base_url}/search/issues"
+        pages = self._paginate(url, {'q': query}, ttl=ACTIVITY_CACHE_TTL, items_key='items')
+        return [item for page in pages for item in page]
+    
+    def search_user_prs(self, username: str, since: Union[datetime, str]) -> List[Dict[str, Any]]:
+        """Search pull requests authored by a user in their own repositories
+        
+        Args:
+            username: GitHub username
+            since: Only return PRs created on or after this date
+            
+        Returns:
+            List of pull request search results
+        """
+        return self._search_issues(
+            f"is:pr author:{username} user:{username} created:>={_utc_timestamp(since)[:10]}"
+        )
+    
+    def search_user_issues(self, username: str, since: Union[datetime, str]) -> List[Dict[str, Any]]:
+        """Search issues authored by a user in their own repositories
+        
+        Args:
+            username: GitHub username
+            since: Only return issues created on or after this date
+            
+        Returns:
+            List of issue search results
+        """
+        return self._search_issues(
+            f"is:issue author:{username} user:{username} created:>={_utc_timestamp(since)[:10]}"
+        )
+    
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a query against the GitHub GraphQL API
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
             
-        response = requests.get(url, headers=self.headers, params=params)
+        Returns:
+            The 'data' object of the response
+        """
+        response = self._request(
+            'POST',
+            GRAPHQL_URL,
+            json={'query': query, 'variables': variables or {}}
+        )
         response.raise_for_status()
         
-        return response.json()
+        result = _json_loads(response.content)
+        errors = result.get('errors')
+        if errors and not result.get('data'):
+            raise RuntimeError(f"GraphQL query failed: {errors[0].get('message', errors)}")
+        if errors:
+            print(f"GraphQL query returned partial results: {errors[0].get('message', errors)}")
+            
+        return result['data']
+    
+    def _get_user_node_id(self, username: str) -> Optional[str]:
+        """Look up the GraphQL node ID of a user
+        
+        Args:
+            username: GitHub username
+            
+        Returns:
+            Node ID, or None if the login is not a user or the lookup failed
+        """
+        try:
+            data = self._graphql(
+                "query($login: String!) { user(login: $login) { id } }",
+                {'login': username}
+            )
+        except Exception as e:
+            print(f"Error looking up GitHub user {username}: {str(e)}")
+            return None
+            
+        user = (data or {}).get('user')
+        return user.get('id') if user else None
+    
+    def _count_commits_graphql(self,
+                               user_id: str,
+                               repos: List[Tuple[str, str]],
+                               since_date: Union[datetime, str]) -> Dict[str, int]:
+        """Count commits by a user in several repositories with one GraphQL query
+        
+        Args:
+            user_id: GraphQL node ID of the user
+            repos: List of (owner, repository name) tuples
+            since_date: Start date for commits
+            
+        Returns:
+            Dictionary of repository name to commit count
+        """
+        # One aliased repository selection per repo, all in a single round trip
+        selections = [
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ "
+            "defaultBranchRef { target { ... on Commit { "
+            "history(since: $since, author: {id: $userId}) { totalCount } "
+            "} } } }"
+            for i, (owner, name) in enumerate(repos)
+        ]
+        query = "query($since: GitTimestamp!, $userId: ID!) { " + " ".join(selections) + " }"
+        
+        data = self._graphql(query, {
+            'since': _utc_timestamp(since_date),
+            'userId': user_id
+        })
+        
+        counts = {}
+        for i, (_, name) in enumerate(repos):
+            # Empty repositories have no default branch
+            branch = (data.get(f"r{i}") or {}).get('defaultBranchRef') or {}
+            target = branch.get('target') or {}
+            counts[name] = target.get('history', {}).get('totalCount', 0)
+            
+        return counts
+    
+    def _count_commits_rest(self,
+                            repos: List[Tuple[str, str]],
+                            since_date: Union[datetime, str],
+                            username: str) -> Dict[str, int]:
+        """Count commits by a user in repositories using the REST API
+        
+        Args:
+            repos: List of (owner, repository name) tuples
+            since_date: Start date for commits
+            username: GitHub username to count commits for
+            
+        Returns:
+            Dictionary of repository name to commit count
+        """
+        counts = {}
+        for owner, name in repos:
+            commits = self.get_repo_commits(
+                owner=owner,
+                repo=name,
+                since=since_date
+            )
+            
+            # Count commits by the user without building a filtered list
+            counts[name] = _count_by_user(commits, 'author', username)
+            
+        return counts
     
     def get_user_activity(self, 
                          username: str, 
@@ -148,94 +666,78 @@ class GitHubManager:
         Returns:
             Dictionary with activity summary
         """
-        # Calculate the date range
-        since_date = datetime.now() - timedelta(days=since_days)
+        # Calculate the date range once and reuse the formatted cutoff for every request
+        now = datetime.now(timezone.utc)
+        since_date = _utc_timestamp(now - timedelta(days=since_days))
         
         # Get user repositories
         repos = self.get_user_repos(username)
+        owned_repos = _owned_repos(repos, username)
         
-        activity = {
-            'username': username,
-            'period': f"Last {since_days} days",
-            'repositories': {},
-            'total_commits': 0,
-            'total_issues_opened': 0,
-            'total_issues_closed': 0,
-            'total_prs': 0
-        }
+        # Seed every owned repository so issue and PR hits are still counted
+        # when its commit count cannot be fetched
+        repositories: Dict[str, RepoActivity] = {name: RepoActivity() for _, name in owned_repos}
         
-        # For each repository, get commits and issues
-        for repo in repos:
-            repo_name = repo['name']
-            repo_owner = repo['owner']['login']
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Issues and PRs for every repository come from two search queries
+            issues_future = executor.submit(self.search_user_issues, username, since_date)
+            prs_future = executor.submit(self.search_user_prs, username, since_date)
             
-            # Skip forks if not owned by the user
-            if repo_owner.lower() != username.lower():
-                continue
-                
-            # Get commits
-            try:
-                commits = self.get_repo_commits(
-                    owner=repo_owner,
-                    repo=repo_name,
-                    since=since_date
-                )
-                
-                # Filter commits by the user
-                user_commits = [
-                    commit for commit in commits
-                    if commit.get('author') and commit['author'].get('login', '').lower() == username.lower()
-                ]
-                
-                # Get issues
-                issues = self.get_repo_issues(
-                    owner=repo_owner,
-                    repo=repo_name,
-                    since=since_date
-                )
-                
-                # Filter issues by the user
-                user_issues = [
-                    issue for issue in issues
-                    if issue.get('user') and issue['user'].get('login', '').lower() == username.lower()
-                ]
-                
-                # Count opened and closed issues
-                opened_issues = len(user_issues)
-                closed_issues = len([i for i in user_issues if i['state'] == 'closed'])
-                
-                # Get pull requests
-                prs = self.get_repo_pull_requests(
-                    owner=repo_owner,
-                    repo=repo_name
-                )
-                
-                # Filter PRs by the user and date
-                user_prs = [
-                    pr for pr in prs
-                    if pr.get('user') and pr['user'].get('login', '').lower() == username.lower()
-                    and datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00')) >= since_date
+            # GraphQL needs the user's node ID; organizations and unresolvable
+            # logins have none, so they use the REST path below
+            user_id = self._get_user_node_id(username) if self.token else None
+            
+            if user_id:
+                # Count commits for a chunk of repositories per GraphQL query
+                chunks = [
+                    owned_repos[i:i + GRAPHQL_CHUNK_SIZE]
+                    for i in range(0, len(owned_repos), GRAPHQL_CHUNK_SIZE)
                 ]
-                
-                # Store repository activity
-                activity['repositories'][repo_name] = {
-                    'commits': len(user_commits),
-                    'issues_opened': opened_issues,
-                    'issues_closed': closed_issues,
-                    'pull_requests': len(user_prs)
+                futures = {
+                    executor.submit(self._count_commits_graphql, user_id, chunk, since_date): chunk
+                    for chunk in chunks
                 }
+            else:
+                # Without GraphQL, fall back to one REST fetch per repository
+                futures = {
+                    executor.submit(self._count_commits_rest, [repo], since_date, username): [repo]
+                    for repo in owned_repos
+                }
+            
+            for future in as_completed(futures):
+                try:
+                    commit_counts = future.result()
+                except Exception as e:
+                    repo_names = ', '.join(name for _, name in futures[future])
+                    print(f"Error processing repository {repo_names}: {str(e)}")
+                    continue
                 
-                # Update totals
-                activity['total_commits'] += len(user_commits)
-                activity['total_issues_opened'] += opened_issues
-                activity['total_issues_closed'] += closed_issues
-                activity['total_prs'] += len(user_prs)
+                # Store repository activity
+                for repo_name, commit_count in commit_counts.items():
+                    repositories.setdefault(repo_name, RepoActivity()).commits = commit_count
+            
+            # Attribute searched issues and PRs to their repositories
+            try:
+                for issue in issues_future.result():
+                    repo_activity = repositories.get(issue['repository_url'].rsplit('/', 1)[-1])
+                    if repo_activity is None:
+                        continue
+                    repo_activity.issues_opened += 1
+                    if issue['state'] == 'closed':
+                        repo_activity.issues_closed += 1
+            except Exception as e:
+                print(f"Error searching issues: {str(e)}")
                 
+            try:
+                for pr in prs_future.result():
+                    repo_activity = repositories.get(pr['repository_url'].rsplit('/', 1)[-1])
+                    if repo_activity is None:
+                        continue
+                    repo_activity.pull_requests += 1
             except Exception as e:
-                print(f"Error processing repository {repo_name}: {str(e)}")
-                continue
+                print(f"Error searching pull requests: {str(e)}")
         
-        return activity
+        return _activity_summary(username, since_days, repositories)
     
     def get_project_status(self, 
                           owner: str, 
@@ -249,9 +751,10 @@ class GitHubManager:
         Returns:
             Dictionary with project status details
         """
+        now = datetime.now()
         status = {
             'repository': f"{owner}/{repo}",
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'open_issues': 0,
             'open_prs': 0,
             'recent_commits': [],
@@ -296,7 +799,7 @@ class GitHubManager:
         
         # Get recent commits
         try:
-            since_date = datetime.now() - timedelta(days=7)
+            since_date = now - timedelta(days=7)
             commits = self.get_repo_commits(owner, repo, since=since_date)
             
             # Get commit details
@@ -310,17 +813,12 @@ class GitHubManager:
                 for commit in commits[:10]  # Get details for 10 most recent
             ]
             
-            # Get unique contributors from recent commits
-            contributors = {}
-            for commit in commits:
-                author = commit['commit']['author']['name']
-                if author not in contributors:
-                    contributors[author] = 0
-                contributors[author] += 1
-                
+            # Get unique contributors from recent commits, most active first
+            contributors = Counter(commit['commit']['author']['name'] for commit in commits)
+            
             status['contributors'] = [
                 {'name': name, 'commits': count}
-                for name, count in contributors.items()
+                for name, count in contributors.most_common()
             ]
         except Exception as e:
             print(f"Error fetching commits: {str(e)}")
@@ -328,6 +826,239 @@ class GitHubManager:
         return status
 
 
+class AsyncGitHubManager:
+    """Asynchronous manager for GitHub activity fan-out using aiohttp
+    
+    All requests share one connection pool on a single event loop, so many
+    repositories can be fetched concurrently without a thread per request.
+    """
+    
+    def __init__(self, token: Optional[str] = None, max_concurrency: int = ASYNC_MAX_CONCURRENCY):
+        """Initialize the async GitHub Manager
+        
+        Args:
+            token: GitHub personal access token
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp library not installed. Run: pip install aiohttp")
+            
+        self.token, self.headers = _github_auth(token)
+        self.base_url = 'https://api.github.com'
+        self.max_concurrency = max_concurrency
+        
+        # Created lazily because aiohttp sessions must be bound to a running loop
+        self._session = None
+        self._semaphore = None
+        
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """Get the shared client session, creating it on first use
+        
+        Returns:
+            aiohttp client session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the client session and release pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            
+    async def __aenter__(self) -> 'AsyncGitHubManager':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+        
+    async def _get_all(self,
+                       url: str,
+                       params: Optional[Dict[str, Any]] = None,
+                       stop: Optional[Callable[[List[Dict[str, Any]]], bool]] = None) -> List[Dict[str, Any]]:
+        """Fetch every page of a list endpoint
+        
+        Args:
+            url: URL of the first page
+            params: Query parameters for the first page
+            stop: Called with each page; pagination ends when it returns True
+            
+        Returns:
+            List of items from all pages
+        """
+        session = await self._get_session()
+        params = dict(params or {})
+        params['per_page'] = PER_PAGE
+        
+        items = []
+        while url:
+            async with self._semaphore:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    page = _json_loads(await response.read())
+                    next_link = response.links.get('next')
+                    
+            items.extend(page)
+            if stop and stop(page):
+                break
+                
+            # The next-page URL already carries the query string
+            url = str(next_link['url']) if next_link else None
+            params = None
+            
+        return items
+    
+    async def get_user_repos(self, username: str) -> List[Dict[str, Any]]:
+        """Get repositories for a specific user
+        
+        Args:
+            username: GitHub username
+            
+        Returns:
+            List of repository dictionaries
+        """
+        return await self._get_all(f"{self.base_url}/users/{username}/repos")
+    
+    async def get_repo_commits(self,
+                               owner: str,
+                               repo: str,
+                               since: Optional[Union[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """Get commits for a specific repository
+        
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            since: Start date for commits, as datetime or ISO-8601 string (optional)
+            
+        Returns:
+            List of commit dictionaries
+        """
+        params = {}
+        if since:
+            params['since'] = _utc_timestamp(since)
+            
+        return await self._get_all(f"{self.base_url}/repos/{owner}/{repo}/commits", params)
+    
+    async def get_repo_issues(self,
+                              owner: str,
+                              repo: str,
+                              state: str = 'all',
+                              since: Optional[Union[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """Get issues for a specific repository
+        
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            state: Issue state ('open', 'closed', or 'all')
+            since: Start date for issues, as datetime or ISO-8601 string (optional)
+            
+        Returns:
+            List of issue dictionaries
+        """
+        params = {'state': state}
+        if since:
+            params['since'] = _utc_timestamp(since)
+            
+        return await self._get_all(f"{self.base_url}/repos/{owner}/{repo}/issues", params)
+    
+    async def get_repo_pull_requests(self,
+                                     owner: str,
+                                     repo: str,
+                                     state: str = 'all',
+                                     since: Optional[Union[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """Get pull requests for a specific repository
+        
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            state: PR state ('open', 'closed', or 'all')
+            since: Only return PRs created at or after this date (optional)
+            
+        Returns:
+            List of pull request dictionaries
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
+        params = {'state': state}
+        
+        if not since:
+            return await self._get_all(url, params)
+            
+        # Newest first, stopping once a page reaches PRs older than the cutoff
+        since_iso = _utc_timestamp(since)
+        params.update({'sort': 'created', 'direction': 'desc'})
+        prs = await self._get_all(url, params, stop=_created_before(since_iso))
+        return [pr for pr in prs if pr['created_at'] >= since_iso]
+    
+    async def _collect_repo_activity(self,
+                                     owner: str,
+                                     repo: str,
+                                     since_date: Union[datetime, str],
+                                     username: str) -> 'RepoActivity':
+        """Collect commit, issue and PR counts for a single repository
+        
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            since_date: Start date for activity
+            username: GitHub username to count activity for
+            
+        Returns:
+            Activity counts for the repository
+        """
+        commits, issues, prs = await asyncio.gather(
+            self.get_repo_commits(owner, repo, since=since_date),
+            self.get_repo_issues(owner, repo, since=since_date),
+            self.get_repo_pull_requests(owner, repo, since=since_date)
+        )
+        
+        # The issues endpoint also lists PRs; drop them to match the is:issue search
+        issues = [issue for issue in issues if 'pull_request' not in issue]
+        closed = [issue for issue in issues if issue['state'] == 'closed']
+        
+        return RepoActivity(
+            commits=_count_by_user(commits, 'author', username),
+            issues_opened=_count_by_user(issues, 'user', username),
+            issues_closed=_count_by_user(closed, 'user', username),
+            pull_requests=_count_by_user(prs, 'user', username)
+        )
+    
+    async def get_user_activity_async(self,
+                                      username: str,
+                                      since_days: int = 7) -> Dict[str, Any]:
+        """Get a summary of user activity across repositories
+        
+        Args:
+            username: GitHub username
+            since_days: Number of days to look back
+            
+        Returns:
+            Dictionary with activity summary
+        """
+        now = datetime.now(timezone.utc)
+        since_date = _utc_timestamp(now - timedelta(days=since_days))
+        repos = await self.get_user_repos(username)
+        owned_repos = _owned_repos(repos, username)
+        
+        results = await asyncio.gather(
+            *(self._collect_repo_activity(owner, repo_name, since_date, username)
+              for owner, repo_name in owned_repos),
+            return_exceptions=True
+        )
+        
+        repositories = {}
+        for (_, repo_name), repo_activity in zip(owned_repos, results):
+            if isinstance(repo_activity, Exception):
+                print(f"Error processing repository {repo_name}: {str(repo_activity)}")
+                continue
+                
+            repositories[repo_name] = repo_activity
+            
+        return _activity_summary(username, since_days, repositories)
+
+
 def main():
     """Example usage of the GitHubManager class"""
     # Use GitHub token from environment variable
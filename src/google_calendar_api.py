@@ -10,22 +10,135 @@ for the Work Schedule Agent system.
 
 import os
 import json
+import functools
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 # In a real implementation, you would use the Google API client library
 # For demonstration purposes, we're showing the structure
 try:
     from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
+    from googleapiclient.model import JsonModel
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
 except ImportError:
     print("Google API libraries not installed. Run: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
 
+# orjson decodes response bodies straight from bytes and much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Maximum number of calls sent in one batched HTTP request
+BATCH_SIZE = 50
+
+
+def _build_model():
+    """Get the response model used for the Calendar service
+    
+    Returns:
+        JsonModel that decodes responses with orjson, or None to use the default
+    """
+    if orjson is None:
+        return None
+        
+    class OrjsonModel(JsonModel):
+        """JsonModel that deserializes response bodies with orjson"""
+        
+        def deserialize(self, content):
+            body = orjson.loads(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+            
+    return OrjsonModel()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_calendar_service(credentials_file: str, token_file: str):
+    """Get an authenticated Google Calendar service, built once per process
+    
+    Args:
+        credentials_file: Path to the credentials.json file
+        token_file: Path to the token.json file
+        
+    Returns:
+        Google Calendar service object
+    """
+    creds = None
+    # The file token.json stores the user's access and refresh tokens
+    if os.path.exists(token_file):
+        with open(token_file, 'rb') as f:
+            token_data = f.read()
+        creds = Credentials.from_authorized_user_info(
+            orjson.loads(token_data) if orjson else json.loads(token_data), SCOPES)
+            
+    # If there are no valid credentials available, let the user log in.
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_file, SCOPES)
+            creds = flow.run_local_server(port=0)
+        # Save the credentials for the next run
+        with open(token_file, 'w') as token:
+            token.write(creds.to_json())
+
+    # Use the discovery document bundled with the client instead of fetching it
+    return build('calendar', 'v3', credentials=creds, model=_build_model(),
+                 static_discovery=True)
+
+
+def _work_block_times(date: datetime,
+                      start_hour: int,
+                      end_hour: int,
+                      block_duration: int,
+                      break_duration: int,
+                      lunch_start: int,
+                      lunch_end: int) -> List[Tuple[datetime, datetime]]:
+    """Compute the start and end times of the work blocks for a day
+    
+    Blocks are laid out back to back (block + break) in the morning window
+    before lunch and the afternoon window after it; only blocks that fit
+    entirely inside a window are kept.
+    
+    Args:
+        date: Date to create blocks for
+        start_hour: Hour to start work blocks (24h format)
+        end_hour: Hour to end work blocks (24h format)
+        block_duration: Duration of each work block in minutes
+        break_duration: Duration of breaks between blocks in minutes
+        lunch_start: Hour to start lunch break (24h format)
+        lunch_end: Hour to end lunch break (24h format)
+        
+    Returns:
+        List of (start, end) datetime pairs
+    """
+    day_start = date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+    day_end = day_start.replace(hour=end_hour)
+    lunch_start_dt = min(max(day_start.replace(hour=lunch_start), day_start), day_end)
+    lunch_end_dt = min(max(day_start.replace(hour=lunch_end), day_start), day_end)
+    
+    block = timedelta(minutes=block_duration)
+    step = timedelta(minutes=block_duration + break_duration)
+    
+    times = []
+    for window_start, window_end in ((day_start, lunch_start_dt), (lunch_end_dt, day_end)):
+        count = max(0, (window_end - window_start - block) // step + 1)
+        times.extend(
+            (window_start + i * step, window_start + i * step + block)
+            for i in range(count)
+        )
+        
+    return times
+
 
 class GoogleCalendarManager:
     """Manager class for Google Calendar operations"""
@@ -47,31 +160,15 @@ class GoogleCalendarManager:
         Returns:
             Google Calendar service object
         """
-        creds = None
-        # The file token.json stores the user's access and refresh tokens
-        if os.path.exists(self.token_file):
-            creds = Credentials.from_authorized_user_info(
-                json.load(open(self.token_file)), SCOPES)
-                
-        # If there are no valid credentials available, let the user log in.
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_file, SCOPES)
-                creds = flow.run_local_server(port=0)
-            # Save the credentials for the next run
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
-
-        return build('calendar', 'v3', credentials=creds)
+        return _get_calendar_service(self.credentials_file, self.token_file)
     
     def get_events(self, 
                   calendar_id: str = 'primary', 
                   time_min: Optional[datetime] = None,
                   time_max: Optional[datetime] = None,
-                  max_results: int = 10) -> List[Dict[str, Any]]:
+                  max_results: int = 10,
+                  q: Optional[str] = None,
+                  fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get events from Google Calendar
         
         Args:
@@ -79,6 +176,8 @@ class GoogleCalendarManager:
             time_min: Start time for events (defaults to now)
             time_max: End time for events (defaults to end of day)
             max_results: Maximum number of events to return
+            q: Free text search terms to filter events server-side (optional)
+            fields: Partial response selector, e.g. 'items(id,summary)' (optional)
             
         Returns:
             List of event dictionaries
@@ -95,20 +194,59 @@ class GoogleCalendarManager:
             timeMax=time_max.isoformat() + 'Z',
             maxResults=max_results,
             singleEvents=True,
-            orderBy='startTime'
+            orderBy='startTime',
+            q=q,
+            fields=fields
         ).execute()
         
         return events_result.get('items', [])
     
-    def create_event(self, 
-                    summary: str,
-                    start_time: datetime,
-                    end_time: datetime,
-                    description: str = '',
-                    location: str = '',
-                    calendar_id: str = 'primary',
-                    project_code: str = None) -> Dict[str, Any]:
-        """Create a new event in Google Calendar
+    def get_events_if_changed(self, 
+                              time_min: datetime,
+                              time_max: datetime,
+                              max_results: int = 10,
+                              etag: Optional[str] = None,
+                              calendar_id: str = 'primary') -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """Get events only if they changed since a previously seen ETag
+        
+        Args:
+            time_min: Start time for events
+            time_max: End time for events
+            max_results: Maximum number of events to return
+            etag: ETag of the previously fetched result (optional)
+            calendar_id: Calendar ID to fetch events from
+            
+        Returns:
+            Tuple of events (None when unchanged) and the current ETag
+        """
+        request = self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min.isoformat() + 'Z',
+            timeMax=time_max.isoformat() + 'Z',
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy='startTime'
+        )
+        if etag:
+            request.headers['If-None-Match'] = etag
+            
+        try:
+            events_result = request.execute()
+        except HttpError as e:
+            if e.resp.status == 304:
+                return None, etag
+            raise
+            
+        return events_result.get('items', []), events_result.get('etag')
+    
+    def _build_event_body(self,
+                          summary: str,
+                          start_time: datetime,
+                          end_time: datetime,
+                          description: str = '',
+                          location: str = '',
+                          project_code: str = None) -> Dict[str, Any]:
+        """Build the request body for a new event
         
         Args:
             summary: Event title
@@ -116,17 +254,16 @@ class GoogleCalendarManager:
             end_time: Event end time
             description: Event description
             location: Event location
-            calendar_id: Calendar ID to create event in
             project_code: Project code for categorization (MAIN, SIDE, PORT)
             
         Returns:
-            Created event dictionary
+            Event resource dictionary
         """
         # Add project code to summary if provided
         if project_code:
             summary = f"[{project_code}] {summary}"
             
-        event = {
+        return {
             'summary': summary,
             'location': location,
             'description': description,
@@ -145,9 +282,68 @@ class GoogleCalendarManager:
                 ],
             },
         }
+    
+    def create_event(self, 
+                    summary: str,
+                    start_time: datetime,
+                    end_time: datetime,
+                    description: str = '',
+                    location: str = '',
+                    calendar_id: str = 'primary',
+                    project_code: str = None) -> Dict[str, Any]:
+        """Create a new event in Google Calendar
+        
+        Args:
+            summary: Event title
+            start_time: Event start time
+            end_time: Event end time
+            description: Event description
+            location: Event location
+            calendar_id: Calendar ID to create event in
+            project_code: Project code for categorization (MAIN, SIDE, PORT)
+            
+        Returns:
+            Created event dictionary
+        """
+        event = self._build_event_body(
+            summary=summary,
+            start_time=start_time,
+            end_time=end_time,
+            description=description,
+            location=location,
+            project_code=project_code
+        )
 
         return self.service.events().insert(calendarId=calendar_id, body=event).execute()
     
+    def create_events_batch(self, 
+                           events: List[Dict[str, Any]],
+                           calendar_id: str = 'primary') -> List[Dict[str, Any]]:
+        """Create several events using batched HTTP requests
+        
+        Args:
+            events: Event resource dictionaries to insert
+            calendar_id: Calendar ID to create events in
+            
+        Returns:
+            List of created event dictionaries, in request order
+        """
+        created_events = []
+        
+        def on_insert(request_id, response, exception):
+            if exception is not None:
+                print(f"Error creating event: {str(exception)}")
+            else:
+                created_events.append(response)
+        
+        for i in range(0, len(events), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_insert)
+            for event in events[i:i + BATCH_SIZE]:
+                batch.add(self.service.events().insert(calendarId=calendar_id, body=event))
+            batch.execute()
+            
+        return created_events
+    
     def update_event(self, 
                     event_id: str,
                     summary: str = None,
@@ -170,22 +366,20 @@ class GoogleCalendarManager:
         Returns:
             Updated event dictionary
         """
-        # Get the existing event
-        event = self.service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-        
-        # Update fields if provided
-        if summary:
-            event['summary'] = summary
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
-        if start_time:
-            event['start']['dateTime'] = start_time.isoformat()
-        if end_time:
-            event['end']['dateTime'] = end_time.isoformat()
+        # Send only the changed fields; patch keeps everything else as is
+        body = {}
+        if summary is not None:
+            body['summary'] = summary
+        if description is not None:
+            body['description'] = description
+        if location is not None:
+            body['location'] = location
+        if start_time is not None:
+            body['start'] = {'dateTime': start_time.isoformat(), 'timeZone': 'UTC'}
+        if end_time is not None:
+            body['end'] = {'dateTime': end_time.isoformat(), 'timeZone': 'UTC'}
             
-        return self.service.events().update(calendarId=calendar_id, eventId=event_id, body=event).execute()
+        return self.service.events().patch(calendarId=calendar_id, eventId=event_id, body=body).execute()
     
     def delete_event(self, event_id: str, calendar_id: str = 'primary') -> None:
         """Delete an event from Google Calendar
@@ -196,6 +390,23 @@ class GoogleCalendarManager:
         """
         self.service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
         
+    def delete_events(self, event_ids: List[str], calendar_id: str = 'primary') -> None:
+        """Delete several events using batched HTTP requests
+        
+        Args:
+            event_ids: IDs of the events to delete
+            calendar_id: Calendar ID containing the events
+        """
+        def on_delete(request_id, response, exception):
+            if exception is not None:
+                print(f"Error deleting event: {str(exception)}")
+        
+        for i in range(0, len(event_ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_delete)
+            for event_id in event_ids[i:i + BATCH_SIZE]:
+                batch.add(self.service.events().delete(calendarId=calendar_id, eventId=event_id))
+            batch.execute()
+        
     def create_work_blocks(self, 
                           date: datetime,
                           start_hour: int = 10,
@@ -220,33 +431,66 @@ class GoogleCalendarManager:
         Returns:
             List of created event dictionaries
         """
-        created_events = []
-        current_time = date.replace(hour=start_hour, minute=0, second=0)
-        end_time = date.replace(hour=end_hour, minute=0, second=0)
-        
-        while current_time < end_time:
-            # Skip lunch time
-            if current_time.hour == lunch_start and current_time.minute == 0:
-                current_time = current_time.replace(hour=lunch_end, minute=0)
-                continue
-                
-            # Calculate block end time
-            block_end = current_time + timedelta(minutes=block_duration)
-            
-            # Create a work block
-            event = self.create_event(
+        # Build the work blocks (inserted below in one batch)
+        blocks = [
+            self._build_event_body(
                 summary="Focus Work Block",
-                start_time=current_time,
+                start_time=block_start,
                 end_time=block_end,
-                description="45-minute focused work session",
-                calendar_id=calendar_id
+                description="45-minute focused work session"
             )
-            created_events.append(event)
+            for block_start, block_end in _work_block_times(
+                date, start_hour, end_hour, block_duration, break_duration, lunch_start, lunch_end
+            )
+        ]
             
-            # Move to next block (after break)
-            current_time = block_end + timedelta(minutes=break_duration)
+        return self.create_events_batch(blocks, calendar_id=calendar_id)
+    
+    def _project_events_request(self,
+                                project_code: str,
+                                time_min: datetime,
+                                time_max: datetime,
+                                calendar_id: str = 'primary'):
+        """Build the events.list request for a project code
+        
+        Args:
+            project_code: Project code to search for
+            time_min: Start time for events
+            time_max: End time for events
+            calendar_id: Calendar ID to fetch events from
             
-        return created_events
+        Returns:
+            Unexecuted events.list request
+        """
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min.isoformat() + 'Z',
+            timeMax=time_max.isoformat() + 'Z',
+            maxResults=100,  # Increase to ensure we get all events
+            singleEvents=True,
+            orderBy='startTime',
+            q=f'[{project_code}]',
+            fields='items(id,summary,start,end)'
+        )
+    
+    def _filter_project_events(self, 
+                               project_code: str, 
+                               response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Keep only the events whose summary carries the project tag
+        
+        Args:
+            project_code: Project code searched for
+            response: events.list response
+            
+        Returns:
+            List of event dictionaries for the project
+        """
+        # The q search also matches descriptions and locations
+        prefix = f'[{project_code}]'
+        return [
+            event for event in response.get('items', [])
+            if (event.get('summary') or '').startswith(prefix)
+        ]
     
     def get_project_events(self, 
                           project_code: str,
@@ -264,25 +508,64 @@ class GoogleCalendarManager:
         Returns:
             List of event dictionaries for the specified project
         """
+        return self.get_project_events_batch(
+            [project_code], time_min=time_min, time_max=time_max, calendar_id=calendar_id
+        )[project_code]
+    
+    def get_project_events_batch(self, 
+                                 project_codes: List[str],
+                                 time_min: Optional[datetime] = None,
+                                 time_max: Optional[datetime] = None,
+                                 calendar_id: str = 'primary') -> Dict[str, List[Dict[str, Any]]]:
+        """Get events for several project codes using batched HTTP requests
+        
+        Args:
+            project_codes: Project codes to filter by (MAIN, SIDE, PORT)
+            time_min: Start time for events (defaults to start of day)
+            time_max: End time for events (defaults to end of day)
+            calendar_id: Calendar ID to fetch events from
+            
+        Returns:
+            Dictionary of project codes to their event dictionaries
+        """
         if time_min is None:
             time_min = datetime.now().replace(hour=0, minute=0, second=0)
             
         if time_max is None:
             time_max = time_min.replace(hour=23, minute=59, second=59)
             
-        events = self.get_events(
-            calendar_id=calendar_id,
-            time_min=time_min,
-            time_max=time_max,
-            max_results=100  # Increase to ensure we get all events
-        )
+        # A single code needs no batch envelope
+        if len(project_codes) == 1:
+            code = project_codes[0]
+            response = self._project_events_request(code, time_min, time_max, calendar_id).execute()
+            return {code: self._filter_project_events(code, response)}
+            
+        project_events = {code: [] for code in project_codes}
+        errors = {}
         
-        # Filter events by project code in summary
-        project_events = [
-            event for event in events 
-            if event.get('summary', '').startswith(f'[{project_code}]')
-        ]
+        def on_list(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                project_events[request_id] = self._filter_project_events(request_id, response)
         
+        codes = list(project_events)
+        for i in range(0, len(codes), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_list)
+            for code in codes[i:i + BATCH_SIZE]:
+                batch.add(
+                    self._project_events_request(code, time_min, time_max, calendar_id),
+                    request_id=code
+                )
+            batch.execute()
+            
+        # A failed query must not read as a project without events
+        if errors:
+            exception = next(iter(errors.values()))
+            raise RuntimeError(
+                f"Error getting events for {', '.join(errors)}: {str(exception)}"
+            ) from exception
+            
         return project_events
 
 
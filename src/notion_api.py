@@ -8,61 +8,262 @@ This module provides functions to interact with Notion API
 with optimized token usage for LLM context.
 """
 
+import io
 import os
+import re
+import sys
 import json
+import asyncio
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 # In a real implementation, you would use the Notion API client library
 # For demonstration purposes, we're showing the structure
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Requests library not installed. Run: pip install requests")
 
+# orjson works on bytes directly and is several times faster than json
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# httpx is only needed for the async methods of NotionManager
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# ijson parses incrementally, so large cached bodies need not be decoded in full
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Number of Notion requests issued concurrently for bulk page fetches
+MAX_WORKERS = 16
+
+# Number of Notion requests in flight at once on the async client
+ASYNC_MAX_CONCURRENCY = 16
+
+# Seconds a cached page stays valid
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Number of serialized entries NotionCache keeps in memory
+MEMORY_CACHE_SIZE = 1024
+
+# Cached bodies larger than this are streamed when only a prefix of their blocks is needed
+STREAM_THRESHOLD_BYTES = 256 * 1024
+
+# Largest page size accepted by the Notion API
+PAGE_SIZE = 100
+
+# Text-bearing block types mapped to (has 'checked' flag, has 'language' field)
+_BLOCK_SPEC = {
+    'paragraph': (False, False),
+    'heading_1': (False, False),
+    'heading_2': (False, False),
+    'heading_3': (False, False),
+    'bulleted_list_item': (False, False),
+    'numbered_list_item': (False, False),
+    'to_do': (True, False),
+    'toggle': (False, False),
+    'code': (False, True),
+}
+
+# Paragraphs matching any of these words are preferred when summarizing a page
+_SUMMARY_KEYWORDS_RE = re.compile(r'important|key|main|critical|essential|conclusion', re.IGNORECASE)
+
+# Slotted dataclasses need Python 3.10; older versions fall back to regular instances
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SimpleBlock:
+    """Text content of a single block; optional fields are None when the type lacks them"""
+    type: str
+    content: str = ''
+    checked: Optional[bool] = None
+    language: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the compact dictionary form used in simplified page content
+        
+        Returns:
+            Dictionary with type and content, plus checked/language when set
+        """
+        result = {'type': self.type, 'content': self.content}
+        if self.checked is not None:
+            result['checked'] = self.checked
+        if self.language is not None:
+            result['language'] = self.language
+        return result
+
+
+def _extract_title_and_tags(properties: Dict[str, Any], 
+                            include_tags: bool = True) -> Tuple[str, List[str]]:
+    """Extract the title and multi-select tags from page properties in one pass
+    
+    Args:
+        properties: Notion page properties
+        include_tags: Whether to look for tags; when False the scan stops at the title
+        
+    Returns:
+        Tuple of title text and tag names
+    """
+    title = None
+    tags = None if include_tags else []
+    
+    for prop in properties.values():
+        prop_type = prop.get('type')
+        if prop_type == 'title' and title is None:
+            title = "".join(text['plain_text'] for text in prop.get('title') or () if 'plain_text' in text)
+        elif prop_type == 'multi_select' and tags is None:
+            tags = [option.get('name', '') for option in prop.get('multi_select') or ()]
+            
+        if title is not None and tags is not None:
+            break
+            
+    return title or "", tags or []
+
 
 class NotionCache:
-    """Cache manager for Notion data to reduce API calls and token usage"""
+    """Cache manager for Notion data to reduce API calls and token usage
     
-    def __init__(self, cache_dir: str = '.notion_cache'):
+    Entries live in a single SQLite database (WAL mode, memory-mapped reads)
+    rather than one JSON file per page, so a lookup is one indexed query.
+    Recently used entries are also kept serialized in memory, so repeat
+    lookups within a process skip the database; every hit is decoded into a
+    fresh object, so callers cannot corrupt the shared cache by mutating it.
+    """
+    
+    _shared: Optional['NotionCache'] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, cache_file: str = '.notion_cache.db'):
         """Initialize the Notion Cache
         
         Args:
-            cache_dir: Directory to store cache files
+            cache_file: Path to the SQLite cache database
         """
-        self.cache_dir = cache_dir
-        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_file = cache_file
+        # Shared by the worker threads used for bulk fetches; access is serialized by the lock
+        self.conn = sqlite3.connect(cache_file, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA mmap_size=268435456;
+            CREATE TABLE IF NOT EXISTS pages(id TEXT PRIMARY KEY, cached_at REAL, body BLOB);
+        """)
+        
+        # page_id -> (cached_at, serialized body), oldest insertion first
+        self._mem: Dict[str, Tuple[float, bytes]] = {}
     
-    def get_cache_path(self, page_id: str) -> str:
-        """Get the cache file path for a page ID
+    @classmethod
+    def shared(cls) -> 'NotionCache':
+        """Get the process-wide cache instance shared by NotionManager objects
+        
+        Returns:
+            Shared NotionCache instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def close(self) -> None:
+        """Close the cache database"""
+        self.conn.close()
+        
+    def _remember(self, page_id: str, cached_at: float, body: bytes) -> None:
+        """Store an entry in the in-memory overlay (caller holds the lock)
         
         Args:
             page_id: Notion page ID
-            
-        Returns:
-            Path to the cache file
+            cached_at: Epoch time the content was cached
+            body: Serialized page content
         """
-        return os.path.join(self.cache_dir, f"{page_id}.json")
+        self._mem.pop(page_id, None)
+        self._mem[page_id] = (cached_at, body)
+        if len(self._mem) > MEMORY_CACHE_SIZE:
+            del self._mem[next(iter(self._mem))]
     
-    def get_cached_page(self, page_id: str) -> Optional[Dict[str, Any]]:
+    def get_cached_page(self, page_id: str, max_items: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Get cached page content if available and not expired
         
         Args:
             page_id: Notion page ID
+            max_items: Number of 'results' entries the caller needs (optional);
+                large block lists are then parsed only up to that point
             
         Returns:
             Cached page content or None if not available
         """
-        cache_path = self.get_cache_path(page_id)
-        if os.path.exists(cache_path):
-            with open(cache_path, 'r') as f:
-                cached_data = json.load(f)
+        # Only entries cached within the last 24 hours are valid
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        
+        with self._lock:
+            entry = self._mem.get(page_id)
+            if entry and entry[0] > cutoff:
+                body = entry[1]
+            else:
+                # Filtering in the query skips reading the body of expired entries
+                row = self.conn.execute(
+                    'SELECT cached_at, body FROM pages WHERE id = ? AND cached_at > ?',
+                    (page_id, cutoff)
+                ).fetchone()
+                if not row:
+                    return None
+                    
+                body = row[1]
+                self._remember(page_id, row[0], body)
+                
+        if max_items and ijson is not None and len(body) > STREAM_THRESHOLD_BYTES:
+            partial = self._stream_results(body, max_items)
+            if partial is not None:
+                return partial
+                
+        return _json_loads(body)
+    
+    @staticmethod
+    def _stream_results(body: bytes, max_items: int) -> Optional[Dict[str, Any]]:
+        """Decode only the first entries of a cached block list
+        
+        Args:
+            body: Serialized cache entry with a 'results' list
+            max_items: Number of entries to decode
+            
+        Returns:
+            Truncated entry marked as having more results, or None when the
+            list is shorter than max_items and must be decoded in full
+        """
+        results = []
+        for item in ijson.items(io.BytesIO(body), 'results.item', use_float=True):
+            results.append(item)
+            if len(results) >= max_items:
+                return {'results': results, 'has_more': True}
                 
-                # Check if cache is still valid (24 hours)
-                last_updated = datetime.fromisoformat(cached_data.get('cached_at', '2000-01-01'))
-                if datetime.now() - last_updated < timedelta(hours=24):
-                    return cached_data.get('content')
         return None
     
     def update_cache(self, page_id: str, content: Dict[str, Any]) -> None:
@@ -72,31 +273,30 @@ class NotionCache:
             page_id: Notion page ID
             content: Page content to cache
         """
-        cache_path = self.get_cache_path(page_id)
-        cache_data = {
-            'content': content,
-            'cached_at': datetime.now().isoformat()
-        }
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
+        body = _json_dumps(content)
+        cached_at = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+                (page_id, cached_at, body)
+            )
+            self._remember(page_id, cached_at, body)
     
-    def get_page_content(self, page_id: str, force_refresh: bool = False) -> Dict[str, Any]:
-        """Get page content from cache or fetch from API
+    def get_page_content(self, 
+                         page_id: str, 
+                         force_refresh: bool = False, 
+                         max_items: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get page content from cache, or None when it must be fetched from the API
         
         Args:
             page_id: Notion page ID
             force_refresh: Whether to force refresh from API
+            max_items: Number of 'results' entries the caller needs (optional)
             
         Returns:
-            Page content
+            Cached page content, or None on a cache miss or forced refresh
         """
-        if not force_refresh:
-            cached_content = self.get_cached_page(page_id)
-            if cached_content:
-                return cached_content
-        
-        # Cache miss or force refresh, return None to indicate need for API call
-        return None
+        return None if force_refresh else self.get_cached_page(page_id, max_items)
 
 
 class NotionManager:
@@ -119,7 +319,86 @@ class NotionManager:
         }
             
         self.base_url = 'https://api.notion.com/v1'
-        self.cache = NotionCache()
+        self.cache = NotionCache.shared()
+        
+        # Reuse one keep-alive connection pool for every API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Search is a read-only POST, so it is safe to retry as well
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retries
+        ))
+        
+        # Created lazily because the async client must be bound to a running loop
+        self._client = None
+        self._semaphore = None
+        
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        # The page cache is shared across managers, so it stays open
+        self.session.close()
+        
+    def __enter__(self) -> 'NotionManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def _get_client(self) -> 'httpx.AsyncClient':
+        """Get the shared async client, creating it on first use
+        
+        Returns:
+            httpx async client
+        """
+        if httpx is None:
+            raise ImportError("httpx library not installed. Run: pip install 'httpx[http2]'")
+            
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            # HTTP/2 multiplexes concurrent requests over a single connection
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+            self._client = httpx.AsyncClient(headers=self.headers, transport=transport)
+            self._semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the async client and release pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            
+    async def __aenter__(self) -> 'NotionManager':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+        self.close()
+        
+    async def _arequest(self, method: str, url: str, **kwargs) -> Any:
+        """Issue a request on the async client and decode the JSON response
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments passed to httpx
+            
+        Returns:
+            Decoded response body
+        """
+        client = self._get_client()
+        async with self._semaphore:
+            response = await client.request(method, url, **kwargs)
+        response.raise_for_status()
+        
+        return _json_loads(response.content)
         
     def get_page(self, page_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """Get a Notion page by ID
@@ -133,69 +412,241 @@ class NotionManager:
         """
         # Try to get from cache first
         cached_page = self.cache.get_page_content(page_id, force_refresh)
-        if cached_page and not force_refresh:
+        if cached_page is not None:
             return cached_page
         
         # Cache miss or force refresh, fetch from API
         url = f"{self.base_url}/pages/{page_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         
-        page_data = response.json()
+        page_data = _json_loads(response.content)
         
         # Update cache
         self.cache.update_cache(page_id, page_data)
         
         return page_data
     
-    def get_block_children(self, block_id: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    def get_block_children(self, 
+                           block_id: str, 
+                           force_refresh: bool = False,
+                           max_blocks: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get children blocks of a block
         
         Args:
             block_id: Block ID (can be a page ID)
             force_refresh: Whether to force refresh from API
+            max_blocks: Stop fetching once this many blocks are retrieved
+                (optional, all blocks by default)
             
         Returns:
             List of child blocks
         """
         # Try to get from cache first
-        cache_key = f"{block_id}_children"
-        cached_blocks = self.cache.get_page_content(cache_key, force_refresh)
-        if cached_blocks and not force_refresh:
-            return cached_blocks
+        cached = self._cached_children(block_id, force_refresh, max_blocks)
+        if cached is not None:
+            return cached
         
-        # Cache miss or force refresh, fetch from API
+        # Cache miss or force refresh, fetch from API page by page
         url = f"{self.base_url}/blocks/{block_id}/children"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
+        blocks_data = []
+        cursor = None
         
-        blocks_data = response.json().get('results', [])
+        while True:
+            response = self.session.get(url, params=self._children_params(len(blocks_data), max_blocks, cursor))
+            response.raise_for_status()
+            
+            has_more, cursor = self._add_children_page(blocks_data, _json_loads(response.content), max_blocks)
+            if cursor is None:
+                break
         
         # Update cache
-        self.cache.update_cache(cache_key, blocks_data)
+        self.cache.update_cache(f"{block_id}_children", {'results': blocks_data, 'has_more': has_more})
         
         return blocks_data
     
-    def search_pages(self, query: str = "", filter_by: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def _cached_children(self, 
+                         block_id: str, 
+                         force_refresh: bool, 
+                         max_blocks: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+        """Get cached child blocks if the cached fetch covers the request
+        
+        Args:
+            block_id: Block ID (can be a page ID)
+            force_refresh: Whether to force refresh from API
+            max_blocks: Number of blocks needed (optional, all blocks by default)
+            
+        Returns:
+            Cached child blocks, or None if they must be fetched
+        """
+        # A partial fetch only satisfies requests that need no more blocks than it holds
+        cached = self.cache.get_page_content(f"{block_id}_children", force_refresh, max_blocks)
+        if isinstance(cached, dict):
+            cached_blocks = cached.get('results', [])
+            if not cached.get('has_more') or (max_blocks and len(cached_blocks) >= max_blocks):
+                return cached_blocks[:max_blocks] if max_blocks else cached_blocks
+                
+        return None
+    
+    def _children_params(self, 
+                         fetched: int, 
+                         max_blocks: Optional[int], 
+                         cursor: Optional[str]) -> Dict[str, Any]:
+        """Build query parameters for the next page of child blocks
+        
+        Args:
+            fetched: Number of blocks fetched so far
+            max_blocks: Number of blocks needed (optional)
+            cursor: Cursor returned with the previous page (optional)
+            
+        Returns:
+            Query parameters
+        """
+        page_size = PAGE_SIZE
+        if max_blocks:
+            page_size = min(PAGE_SIZE, max_blocks - fetched)
+        params = {'page_size': page_size}
+        if cursor:
+            params['start_cursor'] = cursor
+        return params
+    
+    def _add_children_page(self, 
+                           blocks_data: List[Dict[str, Any]], 
+                           data: Dict[str, Any], 
+                           max_blocks: Optional[int]) -> Tuple[bool, Optional[str]]:
+        """Append a page of child blocks and decide whether to fetch another
+        
+        Args:
+            blocks_data: Blocks fetched so far, extended in place
+            data: Decoded page of results
+            max_blocks: Number of blocks needed (optional)
+            
+        Returns:
+            Tuple of whether the API has more blocks and the cursor of the next
+            page to fetch, or None when fetching is done
+        """
+        blocks_data.extend(data.get('results', []))
+        has_more = bool(data.get('has_more'))
+        if not has_more or (max_blocks and len(blocks_data) >= max_blocks):
+            return has_more, None
+        return has_more, data.get('next_cursor')
+    
+    async def get_page_async(self, page_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get a Notion page by ID without blocking the event loop on the network
+        
+        Args:
+            page_id: Notion page ID
+            force_refresh: Whether to force refresh from API
+            
+        Returns:
+            Page data
+        """
+        cached_page = self.cache.get_page_content(page_id, force_refresh)
+        if cached_page is not None:
+            return cached_page
+            
+        page_data = await self._arequest('GET', f"{self.base_url}/pages/{page_id}")
+        self.cache.update_cache(page_id, page_data)
+        
+        return page_data
+    
+    async def get_block_children_async(self, 
+                                       block_id: str, 
+                                       force_refresh: bool = False,
+                                       max_blocks: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get children blocks of a block on the async client
+        
+        Args:
+            block_id: Block ID (can be a page ID)
+            force_refresh: Whether to force refresh from API
+            max_blocks: Stop fetching once this many blocks are retrieved
+                (optional, all blocks by default)
+            
+        Returns:
+            List of child blocks
+        """
+        cached = self._cached_children(block_id, force_refresh, max_blocks)
+        if cached is not None:
+            return cached
+            
+        url = f"{self.base_url}/blocks/{block_id}/children"
+        blocks_data = []
+        cursor = None
+        
+        while True:
+            data = await self._arequest('GET', url, params=self._children_params(len(blocks_data), max_blocks, cursor))
+            has_more, cursor = self._add_children_page(blocks_data, data, max_blocks)
+            if cursor is None:
+                break
+                
+        self.cache.update_cache(f"{block_id}_children", {'results': blocks_data, 'has_more': has_more})
+        
+        return blocks_data
+    
+    def search_pages(self, 
+                     query: str = "", 
+                     filter_by: Dict[str, Any] = None,
+                     page_size: int = PAGE_SIZE) -> List[Dict[str, Any]]:
         """Search for pages in Notion
         
         Args:
             query: Search query
             filter_by: Filter criteria
+            page_size: Maximum number of results to return (up to 100)
             
         Returns:
-            List of matching pages
+            List of matching pages, most recently edited first
         """
         url = f"{self.base_url}/search"
-        data = {"query": query}
+        response = self.session.post(url, json=self._search_payload(query, filter_by, page_size))
+        response.raise_for_status()
+        
+        return _json_loads(response.content).get('results', [])
+    
+    def _search_payload(self, 
+                        query: str, 
+                        filter_by: Optional[Dict[str, Any]], 
+                        page_size: int) -> Dict[str, Any]:
+        """Build the request body for a search, most recently edited first
+        
+        Args:
+            query: Search query
+            filter_by: Filter criteria (optional)
+            page_size: Maximum number of results to return (up to 100)
+            
+        Returns:
+            Search request body
+        """
+        data = {
+            "query": query,
+            "sort": {"direction": "descending", "timestamp": "last_edited_time"},
+            "page_size": page_size
+        }
         
         if filter_by:
             data["filter"] = filter_by
             
-        response = requests.post(url, headers=self.headers, json=data)
-        response.raise_for_status()
+        return data
+    
+    async def search_pages_async(self, 
+                                 query: str = "", 
+                                 filter_by: Dict[str, Any] = None,
+                                 page_size: int = PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Search for pages in Notion on the async client
         
-        return response.json().get('results', [])
+        Args:
+            query: Search query
+            filter_by: Filter criteria
+            page_size: Maximum number of results to return (up to 100)
+            
+        Returns:
+            List of matching pages, most recently edited first
+        """
+        result = await self._arequest(
+            'POST', f"{self.base_url}/search", json=self._search_payload(query, filter_by, page_size)
+        )
+        
+        return result.get('results', [])
     
     def extract_plain_text(self, rich_text: List[Dict[str, Any]]) -> str:
         """Extract plain text from Notion rich text format
@@ -209,9 +660,9 @@ class NotionManager:
         if not rich_text:
             return ""
             
-        return "".join([text.get('plain_text', '') for text in rich_text])
+        return "".join(text['plain_text'] for text in rich_text if 'plain_text' in text)
     
-    def simplify_block_content(self, block: Dict[str, Any]) -> Dict[str, str]:
+    def simplify_block_content(self, block: Dict[str, Any]) -> SimpleBlock:
         """Simplify a block to extract just the text content
         
         Args:
@@ -221,65 +672,42 @@ class NotionManager:
             Simplified block with type and content
         """
         block_type = block.get('type')
-        simplified = {
-            'type': block_type,
-            'content': ''
-        }
-        
-        if block_type == 'paragraph':
-            simplified['content'] = self.extract_plain_text(block.get('paragraph', {}).get('rich_text', []))
-        elif block_type == 'heading_1':
-            simplified['content'] = self.extract_plain_text(block.get('heading_1', {}).get('rich_text', []))
-        elif block_type == 'heading_2':
-            simplified['content'] = self.extract_plain_text(block.get('heading_2', {}).get('rich_text', []))
-        elif block_type == 'heading_3':
-            simplified['content'] = self.extract_plain_text(block.get('heading_3', {}).get('rich_text', []))
-        elif block_type == 'bulleted_list_item':
-            simplified['content'] = self.extract_plain_text(block.get('bulleted_list_item', {}).get('rich_text', []))
-        elif block_type == 'numbered_list_item':
-            simplified['content'] = self.extract_plain_text(block.get('numbered_list_item', {}).get('rich_text', []))
-        elif block_type == 'to_do':
-            simplified['content'] = self.extract_plain_text(block.get('to_do', {}).get('rich_text', []))
-            simplified['checked'] = block.get('to_do', {}).get('checked', False)
-        elif block_type == 'toggle':
-            simplified['content'] = self.extract_plain_text(block.get('toggle', {}).get('rich_text', []))
-        elif block_type == 'code':
-            simplified['content'] = self.extract_plain_text(block.get('code', {}).get('rich_text', []))
-            simplified['language'] = block.get('code', {}).get('language', '')
-        
-        return simplified
+        spec = _BLOCK_SPEC.get(block_type)
+        if spec is None:
+            return SimpleBlock(block_type)
+            
+        has_checked, has_language = spec
+        payload = block.get(block_type) or {}
+        return SimpleBlock(
+            block_type,
+            "".join(text['plain_text'] for text in payload.get('rich_text') or () if 'plain_text' in text),
+            payload.get('checked', False) if has_checked else None,
+            payload.get('language', '') if has_language else None
+        )
     
-    def get_page_content_simplified(self, page_id: str, max_blocks: int = 50) -> Dict[str, Any]:
-        """Get simplified page content with reduced token usage
+    def _simplify_page(self, 
+                       page_id: str, 
+                       page: Dict[str, Any], 
+                       blocks: List[Dict[str, Any]], 
+                       max_blocks: int) -> Dict[str, Any]:
+        """Build simplified page content from fetched page data and blocks
         
         Args:
             page_id: Notion page ID
-            max_blocks: Maximum number of blocks to retrieve
+            page: Page data
+            blocks: Child blocks of the page
+            max_blocks: Maximum number of blocks to include
             
         Returns:
             Simplified page content
         """
-        # Get page metadata
-        page = self.get_page(page_id)
-        
         # Get page title
-        title = ""
-        properties = page.get('properties', {})
-        for prop in properties.values():
-            if prop.get('type') == 'title':
-                title = self.extract_plain_text(prop.get('title', []))
-                break
+        title, _ = _extract_title_and_tags(page.get('properties', {}), include_tags=False)
         
-        # Get page blocks
-        blocks = self.get_block_children(page_id)
-        
-        # Simplify blocks to reduce token usage
-        simplified_blocks = []
-        for i, block in enumerate(blocks):
-            if i >= max_blocks:
-                break
-                
-            simplified_blocks.append(self.simplify_block_content(block))
+        # Simplify blocks to reduce token usage; dictionaries are only built here at the output boundary
+        simplified_blocks = [
+            self.simplify_block_content(block).to_dict() for block in islice(blocks, max_blocks)
+        ]
         
         return {
             'id': page_id,
@@ -290,6 +718,75 @@ class NotionManager:
             'blocks': simplified_blocks
         }
     
+    def get_page_content_simplified(self, page_id: str, max_blocks: int = 50) -> Dict[str, Any]:
+        """Get simplified page content with reduced token usage
+        
+        Args:
+            page_id: Notion page ID
+            max_blocks: Maximum number of blocks to retrieve
+            
+        Returns:
+            Simplified page content
+        """
+        # Get page metadata and blocks
+        page = self.get_page(page_id)
+        blocks = self.get_block_children(page_id, max_blocks=max_blocks)
+        
+        return self._simplify_page(page_id, page, blocks, max_blocks)
+    
+    def get_pages_content_simplified(self, 
+                                     page_ids: List[str], 
+                                     max_blocks: int = 50) -> Dict[str, Dict[str, Any]]:
+        """Get simplified content for several pages, fetching them concurrently
+        
+        Args:
+            page_ids: Notion page IDs
+            max_blocks: Maximum number of blocks to retrieve per page
+            
+        Returns:
+            Dictionary of page IDs to simplified page content
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Page metadata and blocks are independent requests, so overlap both
+            page_futures = {page_id: executor.submit(self.get_page, page_id) for page_id in page_ids}
+            block_futures = {
+                page_id: executor.submit(self.get_block_children, page_id, max_blocks=max_blocks)
+                for page_id in page_ids
+            }
+            
+            return {
+                page_id: self._simplify_page(
+                    page_id,
+                    page_futures[page_id].result(),
+                    block_futures[page_id].result(),
+                    max_blocks
+                )
+                for page_id in page_ids
+            }
+    
+    async def get_pages_content_simplified_async(self, 
+                                                 page_ids: List[str], 
+                                                 max_blocks: int = 50) -> Dict[str, Dict[str, Any]]:
+        """Get simplified content for several pages, overlapping every request on one loop
+        
+        Args:
+            page_ids: Notion page IDs
+            max_blocks: Maximum number of blocks to retrieve per page
+            
+        Returns:
+            Dictionary of page IDs to simplified page content
+        """
+        pages, blocks = await asyncio.gather(
+            asyncio.gather(*(self.get_page_async(page_id) for page_id in page_ids)),
+            asyncio.gather(*(self.get_block_children_async(page_id, max_blocks=max_blocks)
+                             for page_id in page_ids))
+        )
+        
+        return {
+            page_id: self._simplify_page(page_id, page, page_blocks, max_blocks)
+            for page_id, page, page_blocks in zip(page_ids, pages, blocks)
+        }
+    
     def generate_page_summary(self, page_id: str, max_length: int = 500) -> str:
         """Generate a summary of a page
         
@@ -300,14 +797,14 @@ class NotionManager:
         Returns:
             Page summary
         """
-        # Get simplified page content
-        content = self.get_page_content_simplified(page_id)
+        # Only block text is needed, so skip the page metadata and the dictionary form
+        blocks = self.get_block_children(page_id, max_blocks=50)
         
         # Extract text from blocks
         text_blocks = []
-        for block in content.get('blocks', []):
-            if block.get('content'):
-                text_blocks.append(block.get('content'))
+        for block in map(self.simplify_block_content, blocks):
+            if block.content:
+                text_blocks.append(block.content)
         
         # Join blocks into a single text
         full_text = "\n".join(text_blocks)
@@ -318,27 +815,66 @@ class NotionManager:
         
         # More sophisticated approach: take first paragraph and important sentences
         paragraphs = full_text.split('\n')
-        summary = paragraphs[0] if paragraphs else ""
+        parts = [paragraphs[0]] if paragraphs else []
+        added = set(parts)
+        summary_length = len(parts[0]) if parts else 0
         
         # Add important sentences containing keywords
-        keywords = ["important", "key", "main", "critical", "essential", "conclusion"]
         for paragraph in paragraphs[1:]:
-            if len(summary) >= max_length:
+            if summary_length >= max_length:
                 break
                 
             # Check if paragraph contains any keywords
-            if any(keyword in paragraph.lower() for keyword in keywords):
-                if len(summary) + len(paragraph) + 1 <= max_length:
-                    summary += "\n" + paragraph
+            if paragraph not in added and _SUMMARY_KEYWORDS_RE.search(paragraph):
+                if summary_length + len(paragraph) + 1 <= max_length:
+                    parts.append(paragraph)
+                    added.add(paragraph)
+                    summary_length += len(paragraph) + 1
         
         # If still under max_length, add more paragraphs
         i = 1
-        while i < len(paragraphs) and len(summary) + len(paragraphs[i]) + 1 <= max_length:
-            if paragraphs[i] not in summary:
-                summary += "\n" + paragraphs[i]
+        while i < len(paragraphs) and summary_length + len(paragraphs[i]) + 1 <= max_length:
+            paragraph = paragraphs[i]
+            if paragraph and paragraph not in added:
+                parts.append(paragraph)
+                added.add(paragraph)
+                summary_length += len(paragraph) + 1
             i += 1
         
-        return summary
+        return "\n".join(parts)
+    
+    def _extract_index_entry(self, page: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Extract the index metadata for a page
+        
+        Args:
+            page: Page object from search results
+            
+        Returns:
+            Tuple of page ID and index entry
+        """
+        # Extract title and tags/keywords if available
+        title, tags = _extract_title_and_tags(page.get('properties', {}))
+        
+        return page.get('id'), {
+            'title': title,
+            'url': page.get('url', ''),
+            'last_edited': page.get('last_edited_time', ''),
+            'created': page.get('created_time', ''),
+            'tags': tags
+        }
+    
+    def _index_filter(self, database_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the search filter used to build a page index
+        
+        Args:
+            database_id: Optional database ID to filter pages
+            
+        Returns:
+            Search filter, or None to search everything
+        """
+        if database_id:
+            return {"property": "object", "value": "page"}
+        return None
     
     def create_notion_page_index(self, database_id: str = None) -> Dict[str, Dict[str, Any]]:
         """Create an index of Notion pages for efficient access
@@ -350,42 +886,23 @@ class NotionManager:
             Dictionary of page IDs to page metadata
         """
         # Search for pages
-        if database_id:
-            filter_by = {"property": "object", "value": "page"}
-            pages = self.search_pages(filter_by=filter_by)
-        else:
-            pages = self.search_pages()
+        pages = self.search_pages(filter_by=self._index_filter(database_id))
         
         # Create index
-        index = {}
-        for page in pages:
-            page_id = page.get('id')
+        return dict(self._extract_index_entry(page) for page in pages)
+    
+    async def create_notion_page_index_async(self, database_id: str = None) -> Dict[str, Dict[str, Any]]:
+        """Create an index of Notion pages using the async client
+        
+        Args:
+            database_id: Optional database ID to filter pages
             
-            # Extract title
-            title = ""
-            properties = page.get('properties', {})
-            for prop in properties.values():
-                if prop.get('type') == 'title':
-                    title = self.extract_plain_text(prop.get('title', []))
-                    break
-            
-            # Extract tags/keywords if available
-            tags = []
-            for prop_name, prop in properties.items():
-                if prop.get('type') == 'multi_select':
-                    tags = [option.get('name', '') for option in prop.get('multi_select', [])]
-                    break
-            
-            # Store in index
-            index[page_id] = {
-                'title': title,
-                'url': page.get('url', ''),
-                'last_edited': page.get('last_edited_time', ''),
-                'created': page.get('created_time', ''),
-                'tags': tags
-            }
+        Returns:
+            Dictionary of page IDs to page metadata
+        """
+        pages = await self.search_pages_async(filter_by=self._index_filter(database_id))
         
-        return index
+        return dict(self._extract_index_entry(page) for page in pages)
     
     def get_recently_updated_pages(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get pages updated in the last N days
@@ -396,33 +913,29 @@ class NotionManager:
         Returns:
             List of recently updated pages
         """
-        # Get all pages
+        # Get pages, most recently edited first
         pages = self.search_pages()
         
-        # Filter by last edited time
-        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        # Notion timestamps are UTC ISO-8601 strings, so compare against a UTC cutoff
+        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S')
         recent_pages = []
         
         for page in pages:
             last_edited = page.get('last_edited_time', '')
-            if last_edited >= cutoff_date:
-                # Extract title
-                title = ""
-                properties = page.get('properties', {})
-                for prop in properties.values():
-                    if prop.get('type') == 'title':
-                        title = self.extract_plain_text(prop.get('title', []))
-                        break
+            
+            # Results are sorted, so every remaining page is older
+            if last_edited < cutoff_date:
+                break
                 
-                recent_pages.append({
-                    'id': page.get('id'),
-                    'title': title,
-                    'url': page.get('url', ''),
-                    'last_edited': last_edited
-                })
-        
-        # Sort by last edited time (most recent first)
-        recent_pages.sort(key=lambda x: x.get('last_edited', ''), reverse=True)
+            # Extract title
+            title, _ = _extract_title_and_tags(page.get('properties', {}), include_tags=False)
+            
+            recent_pages.append({
+                'id': page.get('id'),
+                'title': title,
+                'url': page.get('url', ''),
+                'last_edited': last_edited
+            })
         
         return recent_pages
 
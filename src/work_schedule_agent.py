@@ -9,20 +9,216 @@ to create a comprehensive work schedule management system.
 """
 
 import os
+import re
+import copy
 import json
+import time
+import hashlib
+import atexit
 import argparse
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import functools
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+# orjson parses bytes directly and is several times faster than json
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    def _json_dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    def _json_dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+
+# NumPy is only used to total event durations in one vectorized pass
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# pyarrow is only used to write productivity history as Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 # Import API modules
 from google_calendar_api import GoogleCalendarManager
 from github_api import GitHubManager
 from notion_api import NotionManager
 
+# Configuration used for any section missing from the config file
+DEFAULT_CONFIG = {
+    'work_hours': {
+        'start': 10,
+        'end': 18,
+        'lunch_start': 12,
+        'lunch_end': 13
+    },
+    'time_blocks': {
+        'work_duration': 45,
+        'break_duration': 15
+    },
+    'projects': {
+        'MAIN': 'Main job tasks',
+        'SIDE': 'Side job projects',
+        'PORT': 'Portfolio preparation',
+        'FAM': 'Family activities'
+    },
+    'github': {
+        'username': '',
+        'repositories': []
+    },
+    'notion': {
+        'databases': []
+    }
+}
+
+# Seconds a cached report stays valid within one process
+REPORT_CACHE_TTL = 5 * 60
+
+# Maximum number of cached reports kept in memory
+REPORT_CACHE_SIZE = 128
+
+# Number of service fetches run concurrently by the agent
+MAX_WORKERS = 4
+
+# Projects with fewer hours than this in the last week are flagged as underserved
+UNDERSERVED_HOURS = 4
+
+# Below this many projects a plain loop beats building NumPy arrays
+VECTORIZE_MIN_PROJECTS = 64
+
+# Event summaries matching this pattern are treated as deadlines
+_DEADLINE_RE = re.compile(r'\b(?:deadlines?|due|overdue|eod|eow)\b', re.IGNORECASE)
+
+# API responses persisted across runs for ETag revalidation
+DISK_CACHE_DIR = os.path.join('logs', '.cache')
+
+# Seconds a persisted response is kept, and the most response files kept at once
+DISK_CACHE_TTL = 24 * 60 * 60
+DISK_CACHE_MAX_FILES = 256
+
+# Columnar productivity history: a Parquet dataset, or SoA JSON lines without pyarrow
+PRODUCTIVITY_DATASET_DIR = os.path.join('logs', 'productivity_columnar')
+PRODUCTIVITY_COLUMNS_FILE = os.path.join('logs', 'productivity_columnar.jsonl')
+
+
+@functools.lru_cache(maxsize=64)
+def _utc_offset_seconds(suffix: str) -> int:
+    """Parse the fraction/offset suffix of an RFC 3339 timestamp into seconds east of UTC
+    
+    Args:
+        suffix: Text after 'YYYY-MM-DDTHH:MM:SS', e.g. '+09:00', '.000Z' or ''
+        
+    Returns:
+        UTC offset in seconds
+    """
+    offset = suffix.lstrip('.0123456789')
+    if not offset or offset == 'Z':
+        return 0
+        
+    sign = -1 if offset[0] == '-' else 1
+    hours, _, minutes = offset[1:].partition(':')
+    return sign * (int(hours) * 3600 + int(minutes or 0) * 60)
+
+
+def _total_minutes(events: List[Dict[str, Any]]) -> float:
+    """Sum the durations of timed events
+    
+    Args:
+        events: Calendar event dictionaries; all-day events are skipped
+        
+    Returns:
+        Total duration in minutes
+    """
+    starts = []
+    ends = []
+    for event in events:
+        start = event.get('start', {}).get('dateTime', '')
+        end = event.get('end', {}).get('dateTime', '')
+        if start and end:
+            starts.append(start)
+            ends.append(end)
+            
+    if not starts:
+        return 0
+        
+    if np is None:
+        return sum(
+            (datetime.fromisoformat(end.replace('Z', '+00:00')) - 
+             datetime.fromisoformat(start.replace('Z', '+00:00'))).total_seconds()
+            for start, end in zip(starts, ends)
+        ) / 60
+        
+    # NumPy only parses naive timestamps, so convert the local part and
+    # subtract the (few, cached) UTC offsets separately
+    def to_utc_seconds(values: List[str]) -> 'np.ndarray':
+        local = np.array([value[:19] for value in values], dtype='datetime64[s]').astype(np.int64)
+        return local - np.array([_utc_offset_seconds(value[19:]) for value in values], dtype=np.int64)
+        
+    return float((to_utc_seconds(ends) - to_utc_seconds(starts)).sum()) / 60
+
+
+def _event_timestamp(field: Dict[str, Any]) -> Optional[float]:
+    """Convert an event start/end field to epoch seconds
+    
+    Args:
+        field: Event 'start' or 'end' dictionary
+        
+    Returns:
+        Epoch seconds, or None if the field has no time; all-day dates count from midnight UTC
+    """
+    if field.get('dateTime'):
+        return datetime.fromisoformat(field['dateTime'].replace('Z', '+00:00')).timestamp()
+    if field.get('date'):
+        return datetime.fromisoformat(field['date']).replace(tzinfo=timezone.utc).timestamp()
+    return None
+
+
+def _event_overlaps(event: Dict[str, Any], window_start: float, window_end: float) -> bool:
+    """Check whether an event overlaps a time window, as the Calendar API's timeMin/timeMax do
+    
+    Args:
+        event: Calendar event dictionary
+        window_start: Window start in epoch seconds
+        window_end: Window end in epoch seconds
+        
+    Returns:
+        True if the event ends after the window starts and starts before it ends
+    """
+    start = _event_timestamp(event.get('start', {}))
+    end = _event_timestamp(event.get('end', {}))
+    return (end is None or end > window_start) and (start is None or start < window_end)
+
 
 class WorkScheduleAgent:
     """Main agent class that integrates all services"""
     
+    # Merged configuration per config file path, valued (file mtime, config)
+    _config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
     def __init__(self, config_file: str = 'config.json'):
         """Initialize the Work Schedule Agent
         
@@ -30,6 +226,14 @@ class WorkScheduleAgent:
             config_file: Path to configuration file
         """
         self.config = self._load_config(config_file)
+        
+        # Config sections read by the methods below, looked up once
+        self._projects = self.config.get('projects', {})
+        self._project_codes = tuple(self._projects.keys())
+        self._work_hours = self.config.get('work_hours', {})
+        self._time_blocks = self.config.get('time_blocks', {})
+        self._github_cfg = self.config.get('github', {})
+        
         self.calendar = GoogleCalendarManager()
         self.github = GitHubManager()
         
@@ -38,60 +242,222 @@ class WorkScheduleAgent:
         if os.environ.get('NOTION_TOKEN'):
             self.notion = NotionManager()
             
-        # Create logs directory if it doesn't exist
-        os.makedirs('logs', exist_ok=True)
+        # Reports keyed by (name, arguments..., hour bucket), valued (cached_at, result)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        
+        # Runs independent service fetches alongside each other
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        
+        # Log index rows are collected here and written once at exit
+        self._pending_index_lines: List[str] = []
+        self._indexed: set = set()
+        atexit.register(self._flush_log_index)
+        
+        # Per-project productivity rows kept column by column for analytics
+        self._productivity_columns: Dict[str, list] = {
+            'date': [], 'project_code': [], 'total_minutes': [], 'events_count': []
+        }
+        atexit.register(self._flush_productivity_columns)
+        
+        # Create logs and response cache directories if they don't exist
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        
+    def _report_key(self, name: str, now: datetime, *args: Any) -> Tuple:
+        """Build the cache key for a report, bucketed by the hour it was requested in
+        
+        Args:
+            name: Report name
+            now: Time the report is requested at
+            *args: Report parameters that change its result
+            
+        Returns:
+            Cache key
+        """
+        return (name, *args, now.strftime('%Y-%m-%d-%H'))
+        
+    def _cached(self, key: Tuple, ttl_seconds: float, producer: Callable[[], Any]) -> Any:
+        """Return a cached report, or produce and cache it when missing or expired
+        
+        Args:
+            key: Cache key
+            ttl_seconds: Seconds a cached value stays valid
+            producer: Called to compute the value on a miss
+            
+        Returns:
+            Cached or freshly produced value
+        """
+        entry = self._cache.get(key)
+        if entry and time.time() - entry[0] < ttl_seconds:
+            return entry[1]
+            
+        value = producer()
+        self._cache.pop(key, None)
+        self._cache[key] = (time.time(), value)
+        if len(self._cache) > REPORT_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+            
+        return value
+        
+    def _disk_cache_path(self, key: str) -> str:
+        """Get the file path for a disk cache key
+        
+        Args:
+            key: Cache key in the form '{service}:{request description}'
+            
+        Returns:
+            Path of the cache file
+        """
+        service, _, request = key.partition(':')
+        digest = hashlib.blake2b(request.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(DISK_CACHE_DIR, f"{service}_{digest}.json")
+    
+    def _disk_cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached API response from disk
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Dictionary with 'value', 'etag' and 'last_modified', or None if not
+            cached or older than DISK_CACHE_TTL
+        """
+        path = self._disk_cache_path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime >= DISK_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _disk_cache_put(self, 
+                        key: str, 
+                        value: Any, 
+                        etag: Optional[str] = None, 
+                        last_modified: Optional[str] = None) -> None:
+        """Persist an API response with its validators
+        
+        Args:
+            key: Cache key
+            value: Response data
+            etag: ETag returned with the response (optional)
+            last_modified: Last-Modified header returned with the response (optional)
+        """
+        path = self._disk_cache_path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps({'value': value, 'etag': etag, 'last_modified': last_modified}))
+        os.replace(tmp_path, path)
+        
+        self._prune_disk_cache()
+        
+    def _prune_disk_cache(self) -> None:
+        """Delete expired response files and the oldest ones beyond DISK_CACHE_MAX_FILES"""
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(DISK_CACHE_DIR)
+                if entry.is_file() and entry.name.endswith('.json')
+            ]
+        except OSError:
+            return
+            
+        entries.sort(reverse=True)
+        cutoff = time.time() - DISK_CACHE_TTL
+        for i, (mtime, path) in enumerate(entries):
+            if i >= DISK_CACHE_MAX_FILES or mtime < cutoff:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def _get_events_cached(self, 
+                           time_min: datetime, 
+                           time_max: datetime, 
+                           max_results: int) -> List[Dict[str, Any]]:
+        """Get calendar events, revalidating a copy cached by an earlier run
+        
+        The calendar is queried for the enclosing whole-hour window, so runs
+        within the same hour share a cache entry and its ETag; the events are
+        then filtered back to the exact requested window.
+        
+        Args:
+            time_min: Start time for events
+            time_max: End time for events
+            max_results: Maximum number of events to return
+            
+        Returns:
+            List of event dictionaries
+        """
+        bucket_min = time_min.replace(minute=0, second=0, microsecond=0)
+        bucket_max = time_max.replace(minute=0, second=0, microsecond=0)
+        if bucket_max < time_max:
+            bucket_max += timedelta(hours=1)
+            
+        key = f"calendar:{bucket_min.isoformat()}|{bucket_max.isoformat()}|{max_results}"
+        cached = self._disk_cache_get(key)
+        
+        events, etag = self.calendar.get_events_if_changed(
+            time_min=bucket_min,
+            time_max=bucket_max,
+            max_results=max_results,
+            etag=cached.get('etag') if cached else None
+        )
+        if events is None:
+            events = cached.get('value', [])
+        else:
+            self._disk_cache_put(key, events, etag)
+            
+        # Naive bounds are sent to the API as UTC, so compare them as UTC too
+        window_start = time_min.replace(tzinfo=timezone.utc).timestamp()
+        window_end = time_max.replace(tzinfo=timezone.utc).timestamp()
+        return [
+            event for event in events
+            if _event_overlaps(event, window_start, window_end)
+        ][:max_results]
         
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from file
         
+        The merged result is cached per path and reused until the file's
+        modification time changes.
+        
         Args:
             config_file: Path to configuration file
             
         Returns:
             Configuration dictionary
         """
-        default_config = {
-            'work_hours': {
-                'start': 10,
-                'end': 18,
-                'lunch_start': 12,
-                'lunch_end': 13
-            },
-            'time_blocks': {
-                'work_duration': 45,
-                'break_duration': 15
-            },
-            'projects': {
-                'MAIN': 'Main job tasks',
-                'SIDE': 'Side job projects',
-                'PORT': 'Portfolio preparation',
-                'FAM': 'Family activities'
-            },
-            'github': {
-                'username': '',
-                'repositories': []
-            },
-            'notion': {
-                'databases': []
-            }
-        }
+        path = os.path.abspath(config_file)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+            
+        cached = self._config_cache.get(path)
+        if cached and mtime is not None and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+            
+        config = copy.deepcopy(DEFAULT_CONFIG)
         
         # Try to load from file
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                loaded_config = json.load(f)
+        if mtime is not None:
+            with open(path, 'rb') as f:
+                loaded_config = _json_loads(f.read())
                 # Merge with default config
                 for key, value in loaded_config.items():
-                    if key in default_config and isinstance(value, dict):
-                        default_config[key].update(value)
+                    if key in config and isinstance(value, dict):
+                        config[key].update(value)
                     else:
-                        default_config[key] = value
+                        config[key] = value
         else:
             # Save default config
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
-                
-        return default_config
+            with open(path, 'wb') as f:
+                f.write(_json_dumps_pretty(config))
+            mtime = os.stat(path).st_mtime
+            
+        self._config_cache[path] = (mtime, config)
+        return copy.deepcopy(config)
     
     def schedule_day(self, date: Optional[datetime] = None) -> Dict[str, Any]:
         """Schedule a day based on current projects and priorities
@@ -102,18 +468,19 @@ class WorkScheduleAgent:
         Returns:
             Dictionary with scheduled events
         """
+        now = datetime.now()
         if date is None:
-            date = datetime.now() + timedelta(days=1)
+            date = now + timedelta(days=1)
             
         # Get work hours from config
-        work_hours = self.config.get('work_hours', {})
+        work_hours = self._work_hours
         start_hour = work_hours.get('start', 10)
         end_hour = work_hours.get('end', 18)
         lunch_start = work_hours.get('lunch_start', 12)
         lunch_end = work_hours.get('lunch_end', 13)
         
         # Get time block settings
-        time_blocks = self.config.get('time_blocks', {})
+        time_blocks = self._time_blocks
         work_duration = time_blocks.get('work_duration', 45)
         break_duration = time_blocks.get('break_duration', 15)
         
@@ -141,7 +508,7 @@ class WorkScheduleAgent:
             ]
         }
         
-        self._log_activity('schedule_day', log_entry)
+        self._log_activity('schedule_day', log_entry, now)
         
         return {
             'date': date.strftime('%Y-%m-%d'),
@@ -149,12 +516,25 @@ class WorkScheduleAgent:
         }
     
     def get_github_status(self) -> Dict[str, Any]:
-        """Get GitHub status for configured repositories
+        """Get GitHub status for configured repositories, reusing a recent result
+        
+        Returns:
+            Dictionary with GitHub status
+        """
+        now = datetime.now()
+        key = self._report_key('github_status', now)
+        return self._cached(key, REPORT_CACHE_TTL, lambda: self._get_github_status(now))
+    
+    def _get_github_status(self, now: datetime) -> Dict[str, Any]:
+        """Fetch GitHub status for configured repositories
         
+        Args:
+            now: Time of the request
+            
         Returns:
             Dictionary with GitHub status
         """
-        github_config = self.config.get('github', {})
+        github_config = self._github_cfg
         username = github_config.get('username', '')
         repositories = github_config.get('repositories', [])
         
@@ -177,13 +557,13 @@ class WorkScheduleAgent:
             
         # Log the GitHub status
         log_entry = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': now.strftime('%Y-%m-%d'),
             'username': username,
             'activity': activity,
             'repositories': list(repo_status.keys())
         }
         
-        self._log_activity('github_status', log_entry)
+        self._log_activity('github_status', log_entry, now)
         
         return {
             'activity': activity,
@@ -191,7 +571,7 @@ class WorkScheduleAgent:
         }
     
     def get_notion_updates(self, days: int = 7) -> Dict[str, Any]:
-        """Get recent Notion updates
+        """Get recent Notion updates, reusing a recent result
         
         Args:
             days: Number of days to look back
@@ -202,15 +582,32 @@ class WorkScheduleAgent:
         if not self.notion:
             return {'error': 'Notion API not configured'}
             
+        now = datetime.now()
+        key = self._report_key('notion_updates', now, days)
+        return self._cached(key, REPORT_CACHE_TTL, lambda: self._get_notion_updates(days, now))
+    
+    def _get_notion_updates(self, days: int, now: datetime) -> Dict[str, Any]:
+        """Fetch recent Notion updates
+        
+        Args:
+            days: Number of days to look back
+            now: Time of the request
+            
+        Returns:
+            Dictionary with Notion updates
+        """
         # Get recently updated pages
         recent_pages = self.notion.get_recently_updated_pages(days)
         
-        # Generate summaries for recent pages
+        # Generate summaries for recent pages concurrently
+        pages = recent_pages[:5]  # Limit to 5 pages to avoid excessive API calls
+        summaries = self._executor.map(
+            self.notion.generate_page_summary, [page.get('id') for page in pages]
+        )
+        
         page_summaries = {}
-        for page in recent_pages[:5]:  # Limit to 5 pages to avoid excessive API calls
-            page_id = page.get('id')
-            summary = self.notion.generate_page_summary(page_id)
-            page_summaries[page_id] = {
+        for page, summary in zip(pages, summaries):
+            page_summaries[page.get('id')] = {
                 'title': page.get('title', ''),
                 'url': page.get('url', ''),
                 'summary': summary
@@ -218,13 +615,13 @@ class WorkScheduleAgent:
             
         # Log the Notion updates
         log_entry = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': now.strftime('%Y-%m-%d'),
             'days_back': days,
             'pages_updated': len(recent_pages),
             'summaries_generated': len(page_summaries)
         }
         
-        self._log_activity('notion_updates', log_entry)
+        self._log_activity('notion_updates', log_entry, now)
         
         return {
             'recent_pages': recent_pages,
@@ -234,68 +631,64 @@ class WorkScheduleAgent:
     def analyze_productivity(self, days: int = 7) -> Dict[str, Any]:
         """Analyze productivity based on calendar events and project activity
         
+        Results are reused for a few minutes, so suggest_focus right after an
+        analysis does not query the calendar again.
+        
+        Args:
+            days: Number of days to analyze
+            
+        Returns:
+            Dictionary with productivity analysis
+        """
+        now = datetime.now()
+        key = self._report_key('analyze_productivity', now, days)
+        return self._cached(key, REPORT_CACHE_TTL, lambda: self._analyze_productivity(days, now))
+    
+    def _analyze_productivity(self, days: int, now: datetime) -> Dict[str, Any]:
+        """Compute the productivity analysis from calendar events and project activity
+        
         Args:
             days: Number of days to analyze
+            now: End of the analyzed period
             
         Returns:
             Dictionary with productivity analysis
         """
         # Calculate date range
-        end_date = datetime.now()
+        end_date = now
         start_date = end_date - timedelta(days=days)
         
+        # Start the GitHub fetch if configured; the calendar client is not
+        # thread-safe, so its calls stay on this thread meanwhile
+        github_future = None
+        github_config = self._github_cfg
+        username = github_config.get('username', '')
+        
+        if username:
+            github_future = self._executor.submit(self.github.get_user_activity, username, since_days=days)
+            
         # Get calendar events for the period
-        events = self.calendar.get_events(
+        events = self._get_events_cached(
             time_min=start_date,
             time_max=end_date,
             max_results=100
         )
         
-        # Categorize events by project code
-        project_events = {}
-        for project_code in self.config.get('projects', {}).keys():
-            project_events[project_code] = self.calendar.get_project_events(
-                project_code=project_code,
-                time_min=start_date,
-                time_max=end_date
-            )
-            
         # Calculate time spent on each project
-        project_time = {}
-        for code, events in project_events.items():
-            total_minutes = 0
-            for event in events:
-                start = event.get('start', {}).get('dateTime', '')
-                end = event.get('end', {}).get('dateTime', '')
-                
-                if start and end:
-                    start_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_time = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    duration = (end_time - start_time).total_seconds() / 60
-                    total_minutes += duration
-                    
-            project_time[code] = {
-                'total_minutes': total_minutes,
-                'total_hours': round(total_minutes / 60, 1),
-                'events_count': len(events)
-            }
+        project_time = self._project_time(start_date, end_date)
             
-        # Get GitHub activity if configured
-        github_activity = None
-        github_config = self.config.get('github', {})
-        username = github_config.get('username', '')
-        
-        if username:
-            github_activity = self.github.get_user_activity(username, since_days=days)
+        # Wait for the GitHub activity
+        github_activity = github_future.result() if github_future else None
             
         # Log the productivity analysis
         log_entry = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': now.strftime('%Y-%m-%d'),
             'days_analyzed': days,
             'project_time': project_time
         }
         
-        self._log_activity('productivity_analysis', log_entry)
+        self._log_activity('productivity_analysis', log_entry, now)
+        self._record_productivity(log_entry['date'], project_time)
         
         return {
             'period': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
@@ -304,6 +697,55 @@ class WorkScheduleAgent:
             'github_activity': github_activity
         }
     
+    def _project_time(self, start_date: datetime, end_date: datetime) -> Dict[str, Dict[str, Any]]:
+        """Total the time spent on each configured project
+        
+        Args:
+            start_date: Start of the period
+            end_date: End of the period
+            
+        Returns:
+            Dictionary of project codes to minutes, hours and event counts
+        """
+        # Categorize events by project code, fetching every project in one batch
+        project_events = self.calendar.get_project_events_batch(
+            project_codes=list(self._project_codes),
+            time_min=start_date,
+            time_max=end_date
+        )
+        
+        project_time = {}
+        for code, code_events in project_events.items():
+            total_minutes = _total_minutes(code_events)
+            project_time[code] = {
+                'total_minutes': total_minutes,
+                'total_hours': round(total_minutes / 60, 1),
+                'events_count': len(code_events)
+            }
+            
+        return project_time
+    
+    def _recent_project_time(self, days: int, now: datetime) -> Dict[str, Dict[str, Any]]:
+        """Get per-project totals, reusing a cached productivity analysis if one exists
+        
+        Args:
+            days: Number of days to look back
+            now: End of the period
+            
+        Returns:
+            Dictionary of project codes to minutes, hours and event counts
+        """
+        entry = self._cache.get(self._report_key('analyze_productivity', now, days))
+        if entry and time.time() - entry[0] < REPORT_CACHE_TTL:
+            return entry[1].get('project_time', {})
+            
+        # Only the project totals are needed, not the period events or GitHub activity
+        return self._cached(
+            self._report_key('project_time', now, days),
+            REPORT_CACHE_TTL,
+            lambda: self._project_time(now - timedelta(days=days), now)
+        )
+    
     def suggest_focus(self) -> Dict[str, Any]:
         """Suggest focus areas based on recent activity and upcoming deadlines
         
@@ -312,54 +754,67 @@ class WorkScheduleAgent:
         """
         # Get today's date
         today = datetime.now()
+        today_date = today.date()
         
         # Get upcoming events (next 7 days)
-        upcoming_events = self.calendar.get_events(
+        upcoming_events = self._get_events_cached(
             time_min=today,
             time_max=today + timedelta(days=7),
             max_results=50
         )
         
-        # Look for events with "deadline" or "due" in the title
+        # Look for events with a deadline keyword in the title
         upcoming_deadlines = []
         for event in upcoming_events:
-            summary = event.get('summary', '').lower()
-            if 'deadline' in summary or 'due' in summary:
-                upcoming_deadlines.append({
-                    'summary': event.get('summary', ''),
-                    'date': event.get('start', {}).get('dateTime', 
-                           event.get('start', {}).get('date', '')),
-                    'days_left': (datetime.fromisoformat(
-                        event.get('start', {}).get('dateTime', 
-                        event.get('start', {}).get('date', '')).split('T')[0]
-                    ) - today.date()).days
-                })
+            summary = event.get('summary', '')
+            if not _DEADLINE_RE.search(summary):
+                continue
+                
+            start_field = event.get('start', {})
+            raw = start_field.get('dateTime') or start_field.get('date') or ''
+            if not raw:
+                continue
                 
-        # Get recent productivity analysis
-        productivity = self.analyze_productivity(days=7)
-        project_time = productivity.get('project_time', {})
+            upcoming_deadlines.append({
+                'summary': summary,
+                'date': raw,
+                'days_left': (date.fromisoformat(raw[:10]) - today_date).days
+            })
+                
+        # Get time spent per project over the last week
+        project_time = self._recent_project_time(7, today)
         
         # Identify underserved projects (less than 4 hours in the last week)
-        underserved_projects = []
-        for code, time_data in project_time.items():
-            if time_data.get('total_hours', 0) < 4:
-                underserved_projects.append({
-                    'code': code,
-                    'name': self.config.get('projects', {}).get(code, ''),
-                    'hours_last_week': time_data.get('total_hours', 0)
-                })
+        codes = list(project_time.keys())
+        hours = [time_data.get('total_hours', 0) for time_data in project_time.values()]
+        if np is not None and len(codes) >= VECTORIZE_MIN_PROJECTS:
+            hours_array = np.array(hours, dtype=float)
+            underserved = [(codes[i], hours[i]) for i in np.flatnonzero(hours_array < UNDERSERVED_HOURS)]
+        else:
+            underserved = [(code, h) for code, h in zip(codes, hours) if h < UNDERSERVED_HOURS]
+            
+        underserved_projects = [
+            {
+                'code': code,
+                'name': self._projects.get(code, ''),
+                'hours_last_week': h
+            }
+            for code, h in underserved
+        ]
                 
         # Generate suggestions
         suggestions = []
         
-        # Suggest focusing on imminent deadlines
-        for deadline in sorted(upcoming_deadlines, key=lambda x: x.get('days_left', 0)):
-            if deadline.get('days_left', 0) <= 3:  # Imminent deadlines (3 days or less)
-                suggestions.append({
-                    'priority': 'high',
-                    'type': 'deadline',
-                    'description': f"Focus on {deadline.get('summary')} due in {deadline.get('days_left')} days"
-                })
+        # Suggest focusing on imminent deadlines (3 days or less); filter before
+        # sorting so only the survivors are ordered
+        imminent = [deadline for deadline in upcoming_deadlines if deadline['days_left'] <= 3]
+        imminent.sort(key=itemgetter('days_left'))
+        for deadline in imminent:
+            suggestions.append({
+                'priority': 'high',
+                'type': 'deadline',
+                'description': f"Focus on {deadline.get('summary')} due in {deadline.get('days_left')} days"
+            })
                 
         # Suggest focusing on underserved projects
         for project in underserved_projects:
@@ -377,7 +832,7 @@ class WorkScheduleAgent:
             'suggestions': len(suggestions)
         }
         
-        self._log_activity('focus_suggestions', log_entry)
+        self._log_activity('focus_suggestions', log_entry, today)
         
         return {
             'date': today.strftime('%Y-%m-%d'),
@@ -386,53 +841,119 @@ class WorkScheduleAgent:
             'suggestions': suggestions
         }
     
-    def _log_activity(self, activity_type: str, data: Dict[str, Any]) -> None:
+    def _log_activity(self, 
+                      activity_type: str, 
+                      data: Dict[str, Any], 
+                      now: Optional[datetime] = None) -> None:
         """Log agent activity
         
+        Entries are appended as one JSON object per line, so logging never
+        has to read back or rewrite earlier entries.
+        
         Args:
             activity_type: Type of activity
             data: Activity data
+            now: Time of the logged operation (defaults to the current time)
         """
-        today = datetime.now().strftime('%Y%m%d')
-        log_file = f"logs/{activity_type}_{today}.json"
-        
-        # Create or append to log file
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-                if isinstance(logs, list):
-                    logs.append(data)
-                else:
-                    logs = [logs, data]
-        else:
-            logs = [data]
+        if now is None:
+            now = datetime.now()
             
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        today = now.strftime('%Y%m%d')
+        log_file = f"logs/{activity_type}_{today}.jsonl"
+        
+        with open(log_file, 'ab') as f:
+            f.write(_json_dumps_line(data))
             
         # Update log index
-        self._update_log_index(activity_type, log_file)
+        self._update_log_index(activity_type, log_file, now)
     
-    def _update_log_index(self, activity_type: str, log_file: str) -> None:
-        """Update the log index file
+    def _update_log_index(self, activity_type: str, log_file: str, now: datetime) -> None:
+        """Queue an entry for the log index file
         
         Args:
             activity_type: Type of activity
             log_file: Path to log file
+            now: Time of the logged operation
         """
+        today = now.strftime('%Y-%m-%d')
+        
+        # One row per log file and day is enough to find its entries
+        key = (today, activity_type, log_file)
+        if key in self._indexed:
+            return
+            
+        self._indexed.add(key)
+        self._pending_index_lines.append(f"| {today} | {activity_type} | [{log_file}]({log_file}) |\n")
+        
+    def _flush_log_index(self) -> None:
+        """Append queued entries to the log index file in a single write"""
+        if not self._pending_index_lines:
+            return
+            
         index_file = 'log_index.md'
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        # Create index file if it doesn't exist
-        if not os.path.exists(index_file):
-            with open(index_file, 'w') as f:
-                f.write("# Activity Log Index\n\n")
-                f.write("| Date | Activity Type | Log File |\n")
-                f.write("|------|--------------|----------|\n")
+        lines = "".join(self._pending_index_lines)
+        self._pending_index_lines.clear()
+        
+        # Create the index with its header, or append when it already exists;
+        # the open mode decides, so there is no separate existence check
+        try:
+            with open(index_file, 'x') as f:
+                f.write(
+                    "# Activity Log Index\n\n"
+                    "| Date | Activity Type | Log File |\n"
+                    "|------|--------------|----------|\n" + lines
+                )
+        except FileExistsError:
+            with open(index_file, 'a') as f:
+                f.write(lines)
+            
+    def _record_productivity(self, date_str: str, project_time: Dict[str, Dict[str, Any]]) -> None:
+        """Queue per-project totals for the columnar productivity history
+        
+        Args:
+            date_str: Date of the analysis (YYYY-MM-DD)
+            project_time: Time spent per project code
+        """
+        columns = self._productivity_columns
+        for code, time_data in project_time.items():
+            columns['date'].append(date_str)
+            columns['project_code'].append(code)
+            columns['total_minutes'].append(float(time_data.get('total_minutes', 0)))
+            columns['events_count'].append(time_data.get('events_count', 0))
+            
+    def _flush_productivity_columns(self) -> None:
+        """Write queued productivity rows as one columnar chunk
+        
+        With pyarrow each run adds a Parquet file to PRODUCTIVITY_DATASET_DIR,
+        which pandas.read_parquet loads as one table. Otherwise the columns are
+        appended as a single JSON line of parallel arrays.
+        """
+        columns = self._productivity_columns
+        if not columns['date']:
+            return
+            
+        if pa is not None:
+            os.makedirs(PRODUCTIVITY_DATASET_DIR, exist_ok=True)
+            path = os.path.join(PRODUCTIVITY_DATASET_DIR, f"{time.time_ns()}.parquet")
+            pq.write_table(pa.table(columns), path)
+        else:
+            with open(PRODUCTIVITY_COLUMNS_FILE, 'ab') as f:
+                f.write(_json_dumps_line(columns))
                 
-        # Add entry to index
-        with open(index_file, 'a') as f:
-            f.write(f"| {today} | {activity_type} | [{log_file}]({log_file}) |\n")
+        for values in columns.values():
+            values.clear()
+
+
+def pretty_print_log(log_file: str) -> None:
+    """Print the entries of a JSON Lines log file with indentation
+    
+    Args:
+        log_file: Path to the log file
+    """
+    with open(log_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                print(json.dumps(_json_loads(line), indent=2))
 
 
 def main():
@@ -440,13 +961,21 @@ def main():
     parser = argparse.ArgumentParser(description='Work Schedule Agent')
     parser.add_argument('command', choices=[
         'schedule_day', 'github_status', 'notion_updates', 
-        'analyze_productivity', 'suggest_focus'
+        'analyze_productivity', 'suggest_focus', 'pretty_log'
     ], help='Command to execute')
     parser.add_argument('--days', type=int, default=7, help='Number of days for analysis')
     parser.add_argument('--config', type=str, default='config.json', help='Path to config file')
+    parser.add_argument('--log-file', type=str, help='Log file to print (pretty_log only)')
     
     args = parser.parse_args()
     
+    # Reading a log needs no API clients
+    if args.command == 'pretty_log':
+        if not args.log_file:
+            parser.error('pretty_log requires --log-file')
+        pretty_print_log(args.log_file)
+        return
+        
     # Initialize agent
     agent = WorkScheduleAgent(config_file=args.config)
     